@@ -4,6 +4,8 @@ import logging
 import re
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from html import unescape
 from html.parser import HTMLParser
 from typing import Dict, List, Optional, Tuple
@@ -42,45 +44,71 @@ class LetterboxdApi:
     WATCHLIST_PAGED_URL_TEMPLATE = "https://letterboxd.com/{username}/watchlist/page/{page}/"
     WATCHLIST_REQUEST_DELAY = 0.5  # seconds
     MAX_REQUEST_RETRIES = 3
+    # Cap concurrent per-user fetches so multi-user setups don't hammer
+    # letterboxd.com; pagination within a user stays sequential
+    MAX_CONCURRENT_USERS = 4
 
     def __init__(
         self,
         usernames: Optional[List[str]] = None,
         watchlist_usernames: Optional[List[str]] = None,
+        database=None,
+        force_refresh: bool = False,
+        session: Optional[requests.Session] = None,
     ):
         self.usernames = usernames or []
         self.watchlist_usernames = watchlist_usernames or []
+        # Optional Database handle enabling ETag/Last-Modified revalidation;
+        # unchanged feeds then come back as bodyless 304s
+        self.database = database
+        self.force_refresh = force_refresh
+        # Pooled session keeps connections alive across pages and polls
+        # instead of paying a TCP/TLS handshake per request
+        self.session = session or requests.Session()
 
     # ------------------------------------------------------------------ RSS --
-    def get_watched_movies(self, usernames: Optional[List[str]] = None) -> List[WatchlistItem]:
-        """Fetch watched movies from all configured users' RSS feeds."""
-        target_usernames = usernames if usernames is not None else self.usernames
-
-        all_items: List[WatchlistItem] = []
-        for username in target_usernames:
-            logger.debug("Fetching Letterboxd RSS feed for user: %s", username)
-            items = self._fetch_user_feed(username)
-            all_items.extend(items)
-            logger.debug("Found %d watched items for %s", len(items), username)
+    def get_watched_movies(
+        self,
+        usernames: Optional[List[str]] = None,
+        min_rating: Optional[float] = None,
+    ):
+        """Yield watched movies from all configured users' RSS feeds.
 
-        logger.debug("Total watched items across all users: %d", len(all_items))
-        return all_items
+        A generator so callers can start processing as soon as the first
+        feed is parsed instead of waiting for every user's feed. When
+        min_rating is given, entries below it are dropped at parse time
+        so they are never materialized downstream.
+        """
+        target_usernames = usernames if usernames is not None else self.usernames
+        if min_rating:
+            fetch = partial(self._fetch_user_feed, min_rating=min_rating)
+        else:
+            fetch = self._fetch_user_feed
+        yield from self._iter_per_user(fetch, target_usernames)
 
-    def _fetch_user_feed(self, username: str) -> List[WatchlistItem]:
+    def _fetch_user_feed(
+        self,
+        username: str,
+        min_rating: Optional[float] = None,
+    ) -> List[WatchlistItem]:
         url = self.RSS_URL_TEMPLATE.format(username=username)
 
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
+            _, xml_content = self._cached_fetch(url, self.WATCHLIST_REQUEST_DELAY)
         except requests.RequestException as exc:
             raise LetterboxdApiError(f"Failed to fetch RSS feed for {username}: {exc}") from exc
 
         try:
-            return self._parse_rss_feed(response.text, username)
+            return self._parse_rss_feed(xml_content, username, min_rating)
         except ET.ParseError as exc:
             raise LetterboxdApiError(f"Failed to parse RSS feed for {username}: {exc}") from exc
 
-    def _parse_rss_feed(self, xml_content: str, username: str) -> List[WatchlistItem]:
+    def _parse_rss_feed(
+        self,
+        xml_content: str,
+        username: str,
+        min_rating: Optional[float] = None,
+    ) -> List[WatchlistItem]:
         root = ET.fromstring(xml_content)
 
         namespaces = {
@@ -97,8 +125,11 @@ class LetterboxdApi:
         for item_elem in channel.findall("item"):
             try:
                 item = self._parse_rss_item(item_elem, namespaces, username)
-                if item:
-                    items.append(item)
+                if item is None:
+                    continue
+                if min_rating and (item.rating is None or item.rating < min_rating):
+                    continue
+                items.append(item)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("Failed to parse RSS item for %s: %s", username, exc)
                 continue
@@ -167,16 +198,52 @@ class LetterboxdApi:
         if not target_usernames:
             return []
 
-        all_items: List[WatchlistItem] = []
-        for username in target_usernames:
-            logger.debug("Fetching Letterboxd watchlist for user: %s", username)
-            items = self._fetch_watchlist_for_user(username)
-            all_items.extend(items)
-            logger.debug("Found %d watchlist items for %s", len(items), username)
-
+        all_items = self._fetch_per_user(self._fetch_watchlist_for_user, target_usernames)
         logger.debug("Total watchlist items across all users: %d", len(all_items))
         return all_items
 
+    def _fetch_per_user(self, fetch, usernames: List[str]) -> List[WatchlistItem]:
+        """Run a per-user fetch over all usernames, returning a combined list.
+
+        Args:
+            fetch: Callable taking a username and returning a list of items
+            usernames: Usernames to fetch
+
+        Returns:
+            Combined list of items across all users
+        """
+        return list(self._iter_per_user(fetch, usernames))
+
+    def _iter_per_user(self, fetch, usernames: List[str]):
+        """Yield items from a per-user fetch, concurrently when several users.
+
+        Each user's feed or watchlist is independent, so multiple users are
+        fetched on a small thread pool; items are yielded in username order
+        as each user's fetch completes, so consumers can start on the first
+        user's items while later fetches are still in flight. The
+        retry/delay mechanics inside each fetch are unchanged.
+
+        Args:
+            fetch: Callable taking a username and returning a list of items
+            usernames: Usernames to fetch
+
+        Yields:
+            WatchlistItem objects across all users
+        """
+        if len(usernames) <= 1:
+            for username in usernames:
+                items = fetch(username)
+                logger.debug("Found %d items for %s", len(items), username)
+                yield from items
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_USERS, len(usernames))
+        ) as pool:
+            for username, items in zip(usernames, pool.map(fetch, usernames)):
+                logger.debug("Found %d items for %s", len(items), username)
+                yield from items
+
     def _fetch_watchlist_for_user(self, username: str) -> List[WatchlistItem]:
         collected: List[WatchlistItem] = []
         seen_slugs: set[str] = set()
@@ -190,8 +257,8 @@ class LetterboxdApi:
                 url = self.WATCHLIST_PAGED_URL_TEMPLATE.format(username=username, page=page)
 
             try:
-                response = self._request_with_retry(url, self.WATCHLIST_REQUEST_DELAY)
-                if response.status_code == 404:
+                status_code, html = self._cached_fetch(url, self.WATCHLIST_REQUEST_DELAY)
+                if status_code == 404:
                     if page == 1:
                         raise LetterboxdApiError(f"Watchlist not found for {username}")
                     break
@@ -200,8 +267,6 @@ class LetterboxdApi:
                     f"Failed to fetch watchlist page {page} for {username}: {exc}"
                 ) from exc
 
-            html = response.text
-
             if total_expected is None:
                 total_expected = self._extract_total_watchlist_count(html)
 
@@ -301,7 +366,53 @@ class LetterboxdApi:
         """Check if there is a next page by looking for the 'next' link in pagination."""
         return 'class="next"' in html and 'paginate-nextprev' in html
 
-    def _request_with_retry(self, url: str, base_delay: float) -> requests.Response:
+    def _cached_fetch(self, url: str, base_delay: float) -> Tuple[int, str]:
+        """Fetch a URL, revalidating against the stored ETag/Last-Modified.
+
+        When a database is attached, the cached validators are sent as
+        If-None-Match / If-Modified-Since; a 304 answer means the poll cost
+        one headers-only round trip and the cached body is reused. Without a
+        database (or with force_refresh) this is a plain fetch.
+
+        Args:
+            url: URL to fetch
+            base_delay: Base retry delay passed to the retry helper
+
+        Returns:
+            Tuple of (status code, body text)
+        """
+        cached = None
+        headers = None
+        if self.database is not None and not self.force_refresh:
+            cached = self.database.get_http_cache(url)
+            if cached:
+                headers = {}
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = self._request_with_retry(url, base_delay, headers=headers)
+
+        if response.status_code == 304 and cached:
+            logger.debug("Not modified, serving cached body: %s", url)
+            return 200, cached["body"]
+
+        if self.database is not None and response.ok:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # Only cache when the server hands out a validator to revalidate with
+            if etag or last_modified:
+                self.database.set_http_cache(url, etag, last_modified, response.text)
+
+        return response.status_code, response.text
+
+    def _request_with_retry(
+        self,
+        url: str,
+        base_delay: float,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
         delay = 0.0
         last_exception: Optional[requests.RequestException] = None
 
@@ -310,7 +421,7 @@ class LetterboxdApi:
                 time.sleep(delay)
 
             try:
-                response = requests.get(url, timeout=30)
+                response = self.session.get(url, timeout=30, headers=headers)
             except requests.RequestException as exc:
                 last_exception = exc
                 delay = base_delay * (attempt + 1)
@@ -36,6 +36,7 @@ class PlexApi:
         database: Optional["Database"] = None,
         cache_max_age_days: int = 7,
         rss_id: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Plex API client.
 
@@ -45,13 +46,14 @@ class PlexApi:
             database: Optional database for metadata caching
             cache_max_age_days: Maximum age of cached metadata in days
             rss_id: Optional RSS feed ID for watchlist (alternative to API)
+            session: Optional shared requests.Session (one is created if omitted)
         """
         self.auth_token = auth_token
         self.client_identifier = client_identifier
         self.database = database
         self.cache_max_age_days = cache_max_age_days
         self.rss_id = rss_id
-        self.session = self._create_session_with_retries()
+        self.session = session or self._create_session_with_retries()
 
     def _create_session_with_retries(self) -> requests.Session:
         """Create a requests session with automatic retry logic.
@@ -118,21 +120,40 @@ class PlexApi:
         Returns:
             List of watchlist items
 
+        Raises:
+            PlexApiError: If API request fails
+        """
+        return list(self.iter_watchlist(force_refresh=force_refresh))
+
+    def iter_watchlist(self, force_refresh: bool = False):
+        """Iterate over the watchlist, yielding items as each page arrives.
+
+        Callers start processing after the first page instead of waiting
+        for the full watchlist, and memory stays bounded by the page size.
+        Detailed-metadata enrichment happens per page (still batched).
+
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh metadata
+
+        Yields:
+            WatchlistItem objects in watchlist order
+
         Raises:
             PlexApiError: If API request fails
         """
         # Use RSS feed if rss_id is provided
         if self.rss_id:
             logger.debug("Using RSS feed for watchlist")
-            return self._get_watchlist_from_rss()
+            yield from self._get_watchlist_from_rss()
+            return
 
         # Otherwise use API
         try:
-            # Fetch watchlist overview with pagination
-            all_metadata = []
+            # Fetch watchlist pages and yield each as soon as it's parsed
             page_size = 50
             start = 0
             total_size = None
+            fetched = 0
 
             while True:
                 response = self.session.get(
@@ -162,55 +183,16 @@ class PlexApi:
                     total_size = media_container.get("totalSize", len(metadata_list))
                     logger.debug(f"Fetching {total_size} items from watchlist")
 
-                all_metadata.extend(metadata_list)
+                fetched += len(metadata_list)
+                yield from self._parse_page(metadata_list, force_refresh)
 
                 # Check if we've fetched everything
-                if len(all_metadata) >= total_size or len(metadata_list) == 0:
+                if fetched >= total_size or len(metadata_list) == 0:
                     break
 
                 start += page_size
                 logger.debug(f"Fetching page starting at {start}")
 
-            metadata_list = all_metadata
-            logger.debug(f"Retrieved {len(metadata_list)} items from watchlist")
-
-            # Check which items need detailed metadata (don't have Guid array)
-            needs_details = []
-            for metadata in metadata_list:
-                rating_key = metadata.get("ratingKey", "")
-                if not metadata.get("Guid") and rating_key:
-                    needs_details.append(rating_key)
-
-            if not needs_details:
-                # All items have Guid already, parse directly
-                items = []
-                for metadata in metadata_list:
-                    item = self._parse_metadata(metadata)
-                    if item:
-                        items.append(item)
-                return items
-
-            # Use caching for detailed metadata if database available
-            detailed_metadata_map = {}
-
-            if self.database and not force_refresh:
-                detailed_metadata_map = self._fetch_with_cache(needs_details)
-            else:
-                detailed_metadata_map = self._fetch_without_cache(needs_details)
-
-            # Merge detailed metadata back into metadata_list
-            items = []
-            for metadata in metadata_list:
-                rating_key = metadata.get("ratingKey", "")
-                if rating_key in detailed_metadata_map:
-                    metadata = detailed_metadata_map[rating_key]
-
-                item = self._parse_metadata(metadata)
-                if item:
-                    items.append(item)
-
-            return items
-
         except requests.RequestException as e:
             # Format error message to be more user-friendly
             error_msg = "Failed to fetch watchlist"
@@ -227,6 +209,41 @@ class PlexApi:
             logger.debug(f"Detailed error: {e}", exc_info=True)
             raise PlexApiError(error_msg)
 
+    def _parse_page(self, metadata_list: list[dict], force_refresh: bool):
+        """Parse one page of watchlist metadata, enriching where needed.
+
+        Args:
+            metadata_list: Raw metadata dicts for one page
+            force_refresh: If True, bypass the metadata cache
+
+        Yields:
+            WatchlistItem objects for the page
+        """
+        # Check which items need detailed metadata (don't have Guid array)
+        needs_details = []
+        for metadata in metadata_list:
+            rating_key = metadata.get("ratingKey", "")
+            if not metadata.get("Guid") and rating_key:
+                needs_details.append(rating_key)
+
+        # Use caching for detailed metadata if database available
+        detailed_metadata_map = {}
+        if needs_details:
+            if self.database and not force_refresh:
+                detailed_metadata_map = self._fetch_with_cache(needs_details)
+            else:
+                detailed_metadata_map = self._fetch_without_cache(needs_details)
+
+        # Merge detailed metadata back into the page
+        for metadata in metadata_list:
+            rating_key = metadata.get("ratingKey", "")
+            if rating_key in detailed_metadata_map:
+                metadata = detailed_metadata_map[rating_key]
+
+            item = self._parse_metadata(metadata)
+            if item:
+                yield item
+
     def _fetch_with_cache(self, rating_keys: list[str]) -> dict[str, dict]:
         """Fetch metadata using cache when possible.
 
@@ -1,10 +1,17 @@
 """Radarr API client for movie management."""
 
+import threading
+import time
+
 import requests
 from typing import Optional
 
 from ..models import ProviderId
 
+# How long the cached library index stays fresh. Long enough to cover a
+# whole sync pass, short enough that follow mode notices outside changes
+LIBRARY_CACHE_TTL = 60
+
 
 class RadarrApiError(Exception):
     """Radarr API error."""
@@ -22,6 +29,7 @@ class RadarrApi:
         root_folder: str,
         monitored: bool = True,
         search_on_add: bool = True,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Radarr API client.
 
@@ -32,6 +40,7 @@ class RadarrApi:
             root_folder: Root folder path
             monitored: Monitor movie
             search_on_add: Search for movie immediately after adding
+            session: Optional shared requests.Session (one is created if omitted)
         """
         self.url = url.rstrip("/")
         self.api_key = api_key
@@ -39,7 +48,13 @@ class RadarrApi:
         self.root_folder = root_folder
         self.monitored = monitored
         self.search_on_add = search_on_add
-        self.session = requests.Session()
+        self.session = session or requests.Session()
+        # TMDB ID -> movie index over the full library, rebuilt at most
+        # once per LIBRARY_CACHE_TTL; the lock keeps concurrent sync
+        # workers from all fetching the library at once
+        self._library_lock = threading.Lock()
+        self._library_by_tmdb = None
+        self._library_fetched_at = 0.0
 
     def _get_headers(self) -> dict:
         """Get headers for Radarr API requests.
@@ -128,30 +143,62 @@ class RadarrApi:
         except requests.RequestException as e:
             raise RadarrApiError(f"Failed to fetch tags: {e}")
 
-    def get_movie_by_tmdb_id(self, tmdb_id: str) -> Optional[dict]:
-        """Get movie by TMDB ID.
-
-        Args:
-            tmdb_id: TMDB ID
+    def get_all_movies(self) -> list[dict]:
+        """Get the full movie library from Radarr.
 
         Returns:
-            Movie dict or None if not found
+            List of movie dictionaries
+
+        Raises:
+            RadarrApiError: If API request fails
         """
         try:
             response = self.session.get(
                 f"{self.url}/api/v3/movie",
                 headers=self._get_headers(),
-                timeout=10,
+                timeout=30,
             )
             response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            raise RadarrApiError(f"Failed to fetch movie library: {e}")
 
-            all_movies = response.json()
-            for movie in all_movies:
-                if str(movie.get("tmdbId")) == str(tmdb_id):
-                    return movie
+    def _get_library_index(self) -> dict:
+        """Get the TMDB ID -> movie index, refreshing it when stale.
 
-            return None
-        except requests.RequestException:
+        One library download serves a whole sync pass instead of one per
+        add_movie existence check.
+
+        Returns:
+            Dict mapping TMDB ID strings to movie dictionaries
+
+        Raises:
+            RadarrApiError: If the library cannot be fetched
+        """
+        with self._library_lock:
+            if (
+                self._library_by_tmdb is None
+                or time.monotonic() - self._library_fetched_at > LIBRARY_CACHE_TTL
+            ):
+                self._library_by_tmdb = {
+                    str(movie.get("tmdbId")): movie
+                    for movie in self.get_all_movies()
+                }
+                self._library_fetched_at = time.monotonic()
+            return self._library_by_tmdb
+
+    def get_movie_by_tmdb_id(self, tmdb_id: str) -> Optional[dict]:
+        """Get movie by TMDB ID.
+
+        Args:
+            tmdb_id: TMDB ID
+
+        Returns:
+            Movie dict or None if not found
+        """
+        try:
+            return self._get_library_index().get(str(tmdb_id))
+        except RadarrApiError:
             return None
 
     def lookup_movie(self, tmdb_id: str) -> Optional[dict]:
@@ -182,6 +229,7 @@ class RadarrApi:
         provider_ids: ProviderId,
         title: str,
         year: Optional[int] = None,
+        defer_search: bool = False,
     ) -> dict:
         """Add a movie to Radarr.
 
@@ -189,9 +237,12 @@ class RadarrApi:
             provider_ids: Provider IDs for the movie
             title: Movie title
             year: Release year
+            defer_search: Skip the per-movie search on add; the caller is
+                expected to trigger one batched search_movies later
 
         Returns:
-            Result dictionary with success status and message
+            Result dictionary with success status, message and an 'added'
+            flag that is False when the movie already existed
 
         Raises:
             RadarrApiError: If movie cannot be added
@@ -203,6 +254,7 @@ class RadarrApi:
         if existing:
             return {
                 "success": True,
+                "added": False,
                 "message": f"Movie already exists in Radarr: {existing.get('title')}",
                 "movie": existing,
             }
@@ -220,7 +272,7 @@ class RadarrApi:
             "rootFolderPath": self.root_folder,
             "monitored": self.monitored,
             "addOptions": {
-                "searchForMovie": self.search_on_add,
+                "searchForMovie": self.search_on_add and not defer_search,
             },
         }
 
@@ -251,11 +303,44 @@ class RadarrApi:
             response.raise_for_status()
             movie_data = response.json()
 
+            # Keep the library index in step so later items in the same
+            # run see this movie without a refetch
+            with self._library_lock:
+                if self._library_by_tmdb is not None:
+                    self._library_by_tmdb[str(movie_data.get("tmdbId"))] = movie_data
+
             return {
                 "success": True,
+                "added": True,
                 "message": f"Successfully added movie: {movie_data.get('title')}",
                 "movie": movie_data,
             }
 
         except requests.RequestException as e:
             raise RadarrApiError(f"Failed to add movie to Radarr: {e}")
+
+    def search_movies(self, movie_ids: list[int]):
+        """Trigger one batched search for several movies.
+
+        A single MoviesSearch command queues all the IDs at once instead
+        of one search task per added movie.
+
+        Args:
+            movie_ids: Radarr movie IDs to search for
+
+        Raises:
+            RadarrApiError: If the command cannot be queued
+        """
+        if not movie_ids:
+            return
+
+        try:
+            response = self.session.post(
+                f"{self.url}/api/v3/command",
+                headers=self._get_headers(),
+                json={"name": "MoviesSearch", "movieIds": movie_ids},
+                timeout=30,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise RadarrApiError(f"Failed to queue movie search: {e}")
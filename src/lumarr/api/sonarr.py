@@ -1,10 +1,17 @@
 """Sonarr API client for TV show management."""
 
+import threading
+import time
+
 import requests
 from typing import Optional
 
 from ..models import ProviderId
 
+# How long the cached library index stays fresh. Long enough to cover a
+# whole sync pass, short enough that follow mode notices outside changes
+LIBRARY_CACHE_TTL = 60
+
 
 class SonarrApiError(Exception):
     """Sonarr API error."""
@@ -23,6 +30,7 @@ class SonarrApi:
         series_type: str = "standard",
         season_folder: bool = True,
         monitor_all: bool = False,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Sonarr API client.
 
@@ -34,6 +42,7 @@ class SonarrApi:
             series_type: Series type (standard, daily, anime)
             season_folder: Use season folders
             monitor_all: Monitor all seasons or just latest
+            session: Optional shared requests.Session (one is created if omitted)
         """
         self.url = url.rstrip("/")
         self.api_key = api_key
@@ -42,7 +51,13 @@ class SonarrApi:
         self.series_type = series_type
         self.season_folder = season_folder
         self.monitor_all = monitor_all
-        self.session = requests.Session()
+        self.session = session or requests.Session()
+        # TVDB ID -> series index over the full library, rebuilt at most
+        # once per LIBRARY_CACHE_TTL; the lock keeps concurrent sync
+        # workers from all fetching the library at once
+        self._library_lock = threading.Lock()
+        self._library_by_tvdb = None
+        self._library_fetched_at = 0.0
 
     def _get_headers(self) -> dict:
         """Get headers for Sonarr API requests.
@@ -131,30 +146,62 @@ class SonarrApi:
         except requests.RequestException as e:
             raise SonarrApiError(f"Failed to fetch tags: {e}")
 
-    def get_series_by_tvdb_id(self, tvdb_id: str) -> Optional[dict]:
-        """Get series by TVDB ID.
-
-        Args:
-            tvdb_id: TVDB ID
+    def get_all_series(self) -> list[dict]:
+        """Get the full series library from Sonarr.
 
         Returns:
-            Series dict or None if not found
+            List of series dictionaries
+
+        Raises:
+            SonarrApiError: If API request fails
         """
         try:
             response = self.session.get(
                 f"{self.url}/api/v3/series",
                 headers=self._get_headers(),
-                timeout=10,
+                timeout=30,
             )
             response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            raise SonarrApiError(f"Failed to fetch series library: {e}")
 
-            all_series = response.json()
-            for series in all_series:
-                if str(series.get("tvdbId")) == str(tvdb_id):
-                    return series
+    def _get_library_index(self) -> dict:
+        """Get the TVDB ID -> series index, refreshing it when stale.
 
-            return None
-        except requests.RequestException:
+        One library download serves a whole sync pass instead of one per
+        add_series existence check.
+
+        Returns:
+            Dict mapping TVDB ID strings to series dictionaries
+
+        Raises:
+            SonarrApiError: If the library cannot be fetched
+        """
+        with self._library_lock:
+            if (
+                self._library_by_tvdb is None
+                or time.monotonic() - self._library_fetched_at > LIBRARY_CACHE_TTL
+            ):
+                self._library_by_tvdb = {
+                    str(series.get("tvdbId")): series
+                    for series in self.get_all_series()
+                }
+                self._library_fetched_at = time.monotonic()
+            return self._library_by_tvdb
+
+    def get_series_by_tvdb_id(self, tvdb_id: str) -> Optional[dict]:
+        """Get series by TVDB ID.
+
+        Args:
+            tvdb_id: TVDB ID
+
+        Returns:
+            Series dict or None if not found
+        """
+        try:
+            return self._get_library_index().get(str(tvdb_id))
+        except SonarrApiError:
             return None
 
     def lookup_series(self, tvdb_id: str) -> Optional[dict]:
@@ -184,15 +231,19 @@ class SonarrApi:
         self,
         provider_ids: ProviderId,
         title: str,
+        defer_search: bool = False,
     ) -> dict:
         """Add a TV series to Sonarr.
 
         Args:
             provider_ids: Provider IDs for the series
             title: Series title
+            defer_search: Skip the per-series episode search on add; the
+                caller is expected to trigger one batched search later
 
         Returns:
-            Result dictionary with success status and message
+            Result dictionary with success status, message and an 'added'
+            flag that is False when the series already existed
 
         Raises:
             SonarrApiError: If series cannot be added
@@ -204,6 +255,7 @@ class SonarrApi:
         if existing:
             return {
                 "success": True,
+                "added": False,
                 "message": f"Series already exists in Sonarr: {existing.get('title')}",
                 "series": existing,
             }
@@ -231,7 +283,7 @@ class SonarrApi:
             "monitored": monitored,
             "addOptions": {
                 "monitor": monitor_type,
-                "searchForMissingEpisodes": True,
+                "searchForMissingEpisodes": not defer_search,
             },
         }
 
@@ -262,11 +314,45 @@ class SonarrApi:
             response.raise_for_status()
             series_data = response.json()
 
+            # Keep the library index in step so later items in the same
+            # run see this series without a refetch
+            with self._library_lock:
+                if self._library_by_tvdb is not None:
+                    self._library_by_tvdb[str(series_data.get("tvdbId"))] = series_data
+
             return {
                 "success": True,
+                "added": True,
                 "message": f"Successfully added series: {series_data.get('title')}",
                 "series": series_data,
             }
 
         except requests.RequestException as e:
             raise SonarrApiError(f"Failed to add series to Sonarr: {e}")
+
+    def search_missing_episodes(self, series_ids: list[int]):
+        """Trigger missing-episode searches for the deferred series.
+
+        One MissingEpisodeSearch command per series: the command model
+        only accepts a singular seriesId, and posting without it would
+        kick off a library-wide missing search. The win over searching
+        on add is the timing - the commands are queued once at the end
+        of the run instead of interleaved with the adds.
+
+        Args:
+            series_ids: Sonarr series IDs whose episodes should be searched
+
+        Raises:
+            SonarrApiError: If a command cannot be queued
+        """
+        try:
+            for series_id in series_ids:
+                response = self.session.post(
+                    f"{self.url}/api/v3/command",
+                    headers=self._get_headers(),
+                    json={"name": "MissingEpisodeSearch", "seriesId": series_id},
+                    timeout=30,
+                )
+                response.raise_for_status()
+        except requests.RequestException as e:
+            raise SonarrApiError(f"Failed to queue episode search: {e}")
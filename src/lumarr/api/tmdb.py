@@ -1,5 +1,7 @@
 """TMDB API client for ID lookups."""
 
+import threading
+
 import requests
 from typing import Optional
 
@@ -16,14 +18,24 @@ class TmdbApi:
 
     BASE_URL = "https://api.themoviedb.org/3"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         """Initialize TMDB API client.
 
         Args:
             api_key: TMDB API key (optional)
+            session: Optional shared requests.Session (one is created if omitted)
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = session or requests.Session()
+        # Memoized /find responses keyed by (external_id, source). The
+        # same unresolved IMDB/TVDB ID is looked up again on every sync
+        # pass in follow mode; one fetch per process is enough
+        self._find_lock = threading.Lock()
+        self._find_cache = {}
 
     def is_configured(self) -> bool:
         """Check if API key is configured.
@@ -48,6 +60,11 @@ class TmdbApi:
         if not self.is_configured():
             return None
 
+        cache_key = (external_id, external_source)
+        with self._find_lock:
+            if cache_key in self._find_cache:
+                return self._find_cache[cache_key]
+
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/find/{external_id}",
@@ -58,10 +75,15 @@ class TmdbApi:
                 timeout=10,
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
         except requests.RequestException:
+            # Transient failure: don't cache, so the next pass can retry
             return None
 
+        with self._find_lock:
+            self._find_cache[cache_key] = result
+        return result
+
     def enhance_provider_ids(
         self, provider_ids: ProviderId, media_type: str
     ) -> ProviderId:
@@ -4,6 +4,8 @@ This module provides common utilities, constants, and patterns used across
 all CLI commands, following the mtm design principles.
 """
 
+import sys
+from functools import lru_cache
 from typing import Any, List, Optional, Sequence
 
 from rich.console import Console
@@ -15,40 +17,52 @@ console = Console()
 # Use these constants for all user-facing messages
 
 # Color scheme
-COLOR_SUCCESS = "green"
-COLOR_ERROR = "red"
-COLOR_WARNING = "yellow"
-COLOR_INFO = "cyan"
-COLOR_DIM = "dim"
+# Interned at load so the style-name strings reused across thousands of
+# console.print calls compare and hash by identity
+COLOR_SUCCESS = sys.intern("green")
+COLOR_ERROR = sys.intern("red")
+COLOR_WARNING = sys.intern("yellow")
+COLOR_INFO = sys.intern("cyan")
+COLOR_DIM = sys.intern("dim")
 
 # Symbols
-SYMBOL_SUCCESS = "✓"
-SYMBOL_ERROR = "✗"
-SYMBOL_WARNING = "⚠"
-SYMBOL_INFO = "ℹ"
+SYMBOL_SUCCESS = sys.intern("✓")
+SYMBOL_ERROR = sys.intern("✗")
+SYMBOL_WARNING = sys.intern("⚠")
+SYMBOL_INFO = sys.intern("ℹ")
 
 # Message prefixes - use these for consistent formatting
-PREFIX_SUCCESS = f"[{COLOR_SUCCESS}]{SYMBOL_SUCCESS}[/{COLOR_SUCCESS}]"
-PREFIX_ERROR = f"[{COLOR_ERROR}]{SYMBOL_ERROR}[/{COLOR_ERROR}]"
-PREFIX_WARNING = f"[{COLOR_WARNING}]{SYMBOL_WARNING}[/{COLOR_WARNING}]"
-PREFIX_INFO = f"[{COLOR_INFO}]{SYMBOL_INFO}[/{COLOR_INFO}]"
+PREFIX_SUCCESS = sys.intern(f"[{COLOR_SUCCESS}]{SYMBOL_SUCCESS}[/{COLOR_SUCCESS}]")
+PREFIX_ERROR = sys.intern(f"[{COLOR_ERROR}]{SYMBOL_ERROR}[/{COLOR_ERROR}]")
+PREFIX_WARNING = sys.intern(f"[{COLOR_WARNING}]{SYMBOL_WARNING}[/{COLOR_WARNING}]")
+PREFIX_INFO = sys.intern(f"[{COLOR_INFO}]{SYMBOL_INFO}[/{COLOR_INFO}]")
+
+# URL schemes recognized by normalize_service_url, hoisted so the check
+# doesn't rebuild the tuple per call
+_URL_SCHEMES = ("http://", "https://")
+
+# Prefix + separator precomputed once so each formatter is a single concatenation
+_SUCCESS_HEAD = PREFIX_SUCCESS + " "
+_ERROR_HEAD = PREFIX_ERROR + " "
+_WARNING_HEAD = PREFIX_WARNING + " "
+_INFO_HEAD = PREFIX_INFO + " "
 
 # Standard message templates
 def success_message(text: str) -> str:
     """Format a success message with standard styling."""
-    return f"{PREFIX_SUCCESS} {text}"
+    return _SUCCESS_HEAD + text
 
 def error_message(text: str) -> str:
     """Format an error message with standard styling."""
-    return f"{PREFIX_ERROR} {text}"
+    return _ERROR_HEAD + text
 
 def warning_message(text: str) -> str:
     """Format a warning message with standard styling."""
-    return f"{PREFIX_WARNING} {text}"
+    return _WARNING_HEAD + text
 
 def info_message(text: str) -> str:
     """Format an info message with standard styling."""
-    return f"{PREFIX_INFO} {text}"
+    return _INFO_HEAD + text
 
 # Helper functions
 
@@ -90,6 +104,11 @@ def print_section_header(title: str) -> None:
     """
     console.print(f"\n[bold cyan]═══ {title} ═══[/bold cyan]\n")
 
+@lru_cache(maxsize=16)
+def _render_connection_test(service: str) -> str:
+    """Render the testing message once per service name."""
+    return f"[{COLOR_INFO}]Testing {service} connection…[/{COLOR_INFO}]"
+
 def print_connection_test(service: str) -> None:
     """
     Print a connection testing message.
@@ -97,7 +116,7 @@ def print_connection_test(service: str) -> None:
     Args:
         service: Name of service being tested
     """
-    console.print(f"[{COLOR_INFO}]Testing {service} connection…[/{COLOR_INFO}]")
+    console.print(_render_connection_test(service))
 
 def print_connection_success(service: str, details: str = "") -> None:
     """
@@ -107,10 +126,8 @@ def print_connection_success(service: str, details: str = "") -> None:
         service: Name of service
         details: Optional additional details
     """
-    message = f"{PREFIX_SUCCESS} {service} connection successful"
-    if details:
-        message += f" ({details})"
-    console.print(f"{message}\n")
+    tail = f" ({details})" if details else ""
+    console.print(f"{PREFIX_SUCCESS} {service} connection successful{tail}\n")
 
 def print_connection_failure(service: str, hint: str = "") -> None:
     """
@@ -125,6 +142,7 @@ def print_connection_failure(service: str, hint: str = "") -> None:
         console.print(f"  [dim]{hint}[/dim]")
 
 
+@lru_cache(maxsize=64)
 def normalize_service_url(url: str) -> str:
     """
     Normalize a service URL by adding http:// if missing.
@@ -145,7 +163,7 @@ def normalize_service_url(url: str) -> str:
         return url
 
     # Already has a protocol
-    if url.startswith(("http://", "https://")):
+    if url.startswith(_URL_SCHEMES):
         return url
 
     # Add http:// prefix for host:port format
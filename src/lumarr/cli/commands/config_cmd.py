@@ -17,7 +17,12 @@ def config_command(ctx):
     your lumarr configuration. The wizard will guide you through
     configuring Plex, Sonarr, Radarr, Letterboxd, and other services.
     """
-    config_path = ctx.obj.config_path if hasattr(ctx.obj, 'config_path') else "config.yaml"
+    # EAFP: the context object always defines config_path in practice, so the
+    # try path is the fast path
+    try:
+        config_path = ctx.obj.config_path
+    except AttributeError:
+        config_path = "config.yaml"
 
     try:
         wizard = ConfigWizard(config_path)
@@ -19,19 +19,25 @@ from ..display import console, _render_history_table
 @with_database
 def history(ctx, database, limit):
     """Show sync history."""
-    db_path = Path(database.db_path) if hasattr(database, 'db_path') else None
+    # EAFP: Database always defines db_path, so the try path is the fast path
+    try:
+        db_path = Path(database.db_path)
+    except AttributeError:
+        db_path = None
 
     if db_path and not db_path.exists():
         console.print("[yellow]No sync history found. Run 'lumarr sync' first.[/yellow]")
         return
 
-    records = database.get_sync_history(limit=limit)
+    # Stream rows from the cursor into the table instead of materializing
+    # the full record list; only the renderable grows with --limit
+    records = database.get_sync_history_iter(limit=limit)
+    table = _render_history_table(records, limit)
 
-    if not records:
+    if table.row_count == 0:
         console.print("[yellow]No sync history found.[/yellow]")
         return
 
-    table = _render_history_table(records, limit)
     console.print(table)
 
 
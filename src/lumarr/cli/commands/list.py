@@ -1,10 +1,35 @@
 """List command group - list Plex and Letterboxd items."""
 
 import sys
+from itertools import chain
 
 import rich_click as click
+from rich.console import Group
 from rich.status import Status
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
+
+# Styles reused across the detailed render loops so Rich doesn't re-parse
+# markup for every row
+_TITLE_STYLE = Style(color="cyan", bold=True)
+_DIM_STYLE = Style(dim=True)
+
+# Star strings indexed by int(rating) so render loops avoid per-row string
+# repetition; the padded variant fills the remainder with empty stars
+_STARS = tuple("★" * n for n in range(6))
+_STARS_PADDED = tuple("★" * n + "☆" * (5 - n) for n in range(6))
+
+# Label spans for the detailed render loops, built once instead of one
+# (text, style) tuple allocation per field per item
+_LBL_TYPE = ("  Type:", _DIM_STYLE)
+_LBL_RATING = ("  Rating:", _DIM_STYLE)
+_LBL_STUDIO = ("  Studio:", _DIM_STYLE)
+_LBL_GENRES = ("  Genres:", _DIM_STYLE)
+_LBL_TMDB = ("  TMDB ID:", _DIM_STYLE)
+_LBL_TVDB = ("  TVDB ID:", _DIM_STYLE)
+_LBL_IMDB = ("  IMDB ID:", _DIM_STYLE)
+_LBL_SUMMARY = ("  Summary:", _DIM_STYLE)
 
 from ...api.letterboxd import LetterboxdApi, LetterboxdApiError
 from ..core import with_database, with_plex
@@ -21,6 +46,10 @@ def list_group(ctx, database):
     """
     # If no subcommand specified, show both
     if ctx.invoked_subcommand is None:
+        # Fetch both sources concurrently so the combined view waits for the
+        # slower one instead of the sum; rendering stays on the main thread
+        _prefetch_sources(ctx, database)
+
         # Show Plex section
         console.print("[bold cyan]═══ Plex Watchlist ═══[/bold cyan]\n")
         try:
@@ -48,6 +77,67 @@ def list_group(ctx, database):
             logging.getLogger(__name__).debug("Letterboxd list error", exc_info=True)
 
 
+def _prefetch_sources(ctx, database):
+    """
+    Fetch Plex and Letterboxd data concurrently before rendering.
+
+    Populates ctx.obj.watchlist_cache and ctx.obj.letterboxd_cache so the
+    invoked subcommands reuse the data. Fetch errors are swallowed here; the
+    subcommand refetches and reports them in its own section.
+
+    Args:
+        ctx: Click context
+        database: Database instance
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ..services.letterboxd import LetterboxdResolver
+    from ..services.plex import PlexService
+
+    config = ctx.obj.config
+    session = ctx.obj.get_http_session()
+
+    def fetch_plex():
+        plex_service = PlexService.from_config(config, database, session=session)
+        with plex_service as plex:
+            ctx.obj.get_watchlist_cached(plex)
+
+    def fetch_letterboxd():
+        resolver = LetterboxdResolver(config)
+        rss_names = resolver.resolve_rss_usernames()
+        watchlist_names = resolver.resolve_watchlist_usernames()
+        if not rss_names and not watchlist_names:
+            return None
+
+        letterboxd = LetterboxdApi(
+            usernames=rss_names,
+            watchlist_usernames=watchlist_names,
+            database=database,
+            session=session,
+        )
+        sources = []
+        if rss_names:
+            sources.append(letterboxd.get_watched_movies(rss_names))
+        if watchlist_names:
+            sources.append(letterboxd.get_watchlist_movies(watchlist_names))
+        return list(chain.from_iterable(sources))
+
+    with console.status("[cyan]Fetching Plex and Letterboxd items...[/cyan]", spinner="dots"):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            plex_future = pool.submit(fetch_plex)
+            lbox_future = pool.submit(fetch_letterboxd)
+
+            try:
+                plex_future.result()
+            except Exception:
+                pass  # list_plex refetches and reports in its section
+
+            try:
+                ctx.obj.letterboxd_cache = lbox_future.result()
+            except Exception:
+                pass  # list_letterboxd refetches and reports in its section
+
+
 @list_group.command('plex')
 @click.option(
     "--detailed",
@@ -66,7 +156,7 @@ def list_group(ctx, database):
 def list_plex(ctx, database, plex, detailed, force_refresh):
     """List Plex watchlist items."""
     with console.status("[cyan]Fetching Plex watchlist...[/cyan]", spinner="dots"):
-        watchlist = plex.get_watchlist(force_refresh=force_refresh)
+        watchlist = ctx.obj.get_watchlist_cached(plex, force_refresh=force_refresh)
 
     if not watchlist:
         console.print("[yellow]Your watchlist is empty.[/yellow]")
@@ -75,31 +165,38 @@ def list_plex(ctx, database, plex, detailed, force_refresh):
     console.print(f"[green]Found {len(watchlist)} items in your watchlist[/green]\n")
 
     if detailed:
+        # Build one renderable per item so Rich renders and flushes once per
+        # item instead of once per line
         for item in watchlist:
-            console.print(f"[bold cyan]{item.title}[/bold cyan] ({item.year or 'N/A'})")
-            console.print(f"  [dim]Type:[/dim] {item.media_type.value}")
+            lines = [
+                Text.assemble((item.title, _TITLE_STYLE), f" ({item.year or 'N/A'})"),
+                Text.assemble(_LBL_TYPE, f" {item.media_type.value}"),
+            ]
 
             if item.content_rating:
-                console.print(f"  [dim]Rating:[/dim] {item.content_rating}")
+                lines.append(Text.assemble(_LBL_RATING, f" {item.content_rating}"))
 
             if item.studio:
-                console.print(f"  [dim]Studio:[/dim] {item.studio}")
+                lines.append(Text.assemble(_LBL_STUDIO, f" {item.studio}"))
 
             if item.genres:
-                console.print(f"  [dim]Genres:[/dim] {', '.join(item.genres)}")
+                lines.append(Text.assemble(_LBL_GENRES, f" {', '.join(item.genres)}"))
 
             if item.provider_ids.tmdb_id:
-                console.print(f"  [dim]TMDB ID:[/dim] {item.provider_ids.tmdb_id}")
+                lines.append(Text.assemble(_LBL_TMDB, f" {item.provider_ids.tmdb_id}"))
             if item.provider_ids.tvdb_id:
-                console.print(f"  [dim]TVDB ID:[/dim] {item.provider_ids.tvdb_id}")
+                lines.append(Text.assemble(_LBL_TVDB, f" {item.provider_ids.tvdb_id}"))
             if item.provider_ids.imdb_id:
-                console.print(f"  [dim]IMDB ID:[/dim] {item.provider_ids.imdb_id}")
+                lines.append(Text.assemble(_LBL_IMDB, f" {item.provider_ids.imdb_id}"))
 
             if item.summary:
-                summary = item.summary[:200] + "..." if len(item.summary) > 200 else item.summary
-                console.print(f"  [dim]Summary:[/dim] {summary}")
+                # Probe one char past the cutoff instead of len(); the slice
+                # is empty (falsy) exactly when no truncation is needed
+                summary = (item.summary[:200] + "...") if item.summary[200:201] else item.summary
+                lines.append(Text.assemble(_LBL_SUMMARY, f" {summary}"))
 
-            console.print()
+            lines.append(Text())
+            console.print(Group(*lines))
     else:
         table = _render_watchlist_table(watchlist, detailed=False)
         console.print(table)
@@ -146,8 +243,10 @@ def list_letterboxd(ctx, database, rss_usernames, watchlist_usernames, min_ratin
     has_cli_params = bool(rss_usernames or watchlist_usernames)
 
     if has_cli_params:
-        rss_names = [*rss_usernames]
-        watchlist_names = [*watchlist_usernames]
+        # Click hands multiple=True options over as tuples; downstream code
+        # only iterates and joins, so copying into lists buys nothing
+        rss_names = rss_usernames
+        watchlist_names = watchlist_usernames
     else:
         rss_names = resolver.resolve_rss_usernames()
         watchlist_names = resolver.resolve_watchlist_usernames()
@@ -160,86 +259,39 @@ def list_letterboxd(ctx, database, rss_usernames, watchlist_usernames, min_ratin
         sys.exit(1)
 
     try:
+        if not has_cli_params and ctx.obj.letterboxd_cache is not None:
+            # Prefetched by list_group's concurrent default path
+            _render_letterboxd_items(ctx.obj.letterboxd_cache, database, min_rating, detailed)
+            return
+
         letterboxd = LetterboxdApi(
             usernames=rss_names,
             watchlist_usernames=watchlist_names,
+            database=database,
+            session=ctx.obj.get_http_session(),
         )
-        items = []
+        sources = []
 
         if rss_names:
             with console.status(
                 f"[cyan]Fetching watched movies from Letterboxd RSS for {', '.join(rss_names)}...[/cyan]",
                 spinner="dots"
             ):
-                items.extend(letterboxd.get_watched_movies(rss_names))
+                # Materialize here so the fetch happens under the spinner;
+                # get_watched_movies is a lazy generator
+                sources.append(list(letterboxd.get_watched_movies(rss_names)))
 
         if watchlist_names:
             with console.status(
                 f"[cyan]Fetching watchlist movies from Letterboxd for {', '.join(watchlist_names)}...[/cyan]",
                 spinner="dots"
             ):
-                items.extend(letterboxd.get_watchlist_movies(watchlist_names))
-
-        # Enrich watchlist items with cached TMDB IDs from database
-        for item in items:
-            if item.letterboxd_id and not item.provider_ids.tmdb_id:
-                cached = database.get_letterboxd_metadata(item.letterboxd_id)
-                if cached and cached.get("tmdb_id"):
-                    item.provider_ids.tmdb_id = cached["tmdb_id"]
+                sources.append(letterboxd.get_watchlist_movies(watchlist_names))
 
-        if not items:
-            console.print("[yellow]No movies found.[/yellow]")
-            return
-
-        if min_rating is not None:
-            original_count = len(items)
-            items = [item for item in items if item.rating is not None and item.rating >= min_rating]
-            skipped = original_count - len(items)
-            if skipped > 0:
-                console.print(f"[dim]Filtered to ratings ≥ {min_rating:.1f}. Skipped {skipped} item(s).[/dim]")
-
-        if not items:
-            console.print("[yellow]No movies found after applying rating filter.[/yellow]")
-            return
+        # Fuse the per-source lists in one sizing pass instead of two extends
+        items = list(chain.from_iterable(sources))
 
-        console.print(f"\n[green]Found {len(items)} movie(s)[/green]\n")
-
-        if detailed:
-            for item in items:
-                console.print(f"[bold cyan]{item.title}[/bold cyan] ({item.year})")
-                if item.rating:
-                    stars = "★" * int(item.rating) + "☆" * (5 - int(item.rating))
-                    console.print(f"  Rating: {stars} ({item.rating}/5.0)")
-                if item.provider_ids and item.provider_ids.tmdb_id:
-                    console.print(f"  TMDB ID: {item.provider_ids.tmdb_id}")
-                if item.summary:
-                    console.print(f"  {item.summary}")
-                console.print()
-        else:
-            table = Table(show_header=True, header_style="bold magenta")
-            table.add_column("Title", style="cyan", no_wrap=False)
-            table.add_column("Year", style="green", width=6)
-            table.add_column("Rating", style="yellow", width=10)
-            table.add_column("TMDB ID", style="blue", width=10)
-
-            for item in items:
-                rating_str = ""
-                if item.rating:
-                    stars = "★" * int(item.rating)
-                    rating_str = f"{stars} {item.rating}"
-
-                tmdb_id = "-"
-                if item.provider_ids and item.provider_ids.tmdb_id:
-                    tmdb_id = item.provider_ids.tmdb_id
-
-                table.add_row(
-                    item.title,
-                    str(item.year) if item.year else "-",
-                    rating_str,
-                    tmdb_id,
-                )
-
-            console.print(table)
+        _render_letterboxd_items(items, database, min_rating, detailed)
 
     except LetterboxdApiError as e:
         console.print(f"[red]Letterboxd Error:[/red] {e}")
@@ -249,5 +301,85 @@ def list_letterboxd(ctx, database, rss_usernames, watchlist_usernames, min_ratin
         sys.exit(1)
 
 
+def _render_letterboxd_items(items, database, min_rating, detailed):
+    """Enrich, filter and render Letterboxd items fetched elsewhere."""
+    # Enrich watchlist items with cached TMDB IDs from database
+    for item in items:
+        if item.letterboxd_id and not item.provider_ids.tmdb_id:
+            cached = database.get_letterboxd_metadata(item.letterboxd_id)
+            if cached and cached.get("tmdb_id"):
+                item.provider_ids.tmdb_id = cached["tmdb_id"]
+
+    if not items:
+        console.print("[yellow]No movies found.[/yellow]")
+        return
+
+    if min_rating is not None:
+        # Filter and count skips in one pass over the items
+        skipped = 0
+        kept = []
+        append = kept.append
+        for item in items:
+            rating = item.rating
+            if rating is not None and rating >= min_rating:
+                append(item)
+            else:
+                skipped += 1
+        items = kept
+        if skipped > 0:
+            console.print(f"[dim]Filtered to ratings ≥ {min_rating:.1f}. Skipped {skipped} item(s).[/dim]")
+
+    if not items:
+        console.print("[yellow]No movies found after applying rating filter.[/yellow]")
+        return
+
+    console.print(f"\n[green]Found {len(items)} movie(s)[/green]\n")
+
+    if detailed:
+        # Buffer each item's lines into one renderable so every item costs
+        # a single render/flush cycle instead of one per field
+        for item in items:
+            lines = [Text.assemble((item.title, _TITLE_STYLE), f" ({item.year})")]
+            if item.rating:
+                stars = _STARS_PADDED[int(item.rating)]
+                lines.append(Text(f"  Rating: {stars} ({item.rating}/5.0)"))
+            if item.provider_ids and item.provider_ids.tmdb_id:
+                lines.append(Text(f"  TMDB ID: {item.provider_ids.tmdb_id}"))
+            if item.summary:
+                lines.append(Text(f"  {item.summary}"))
+            lines.append(Text())
+            console.print(Group(*lines))
+    else:
+        table = Table(
+            show_header=True,
+            header_style="bold magenta",
+            expand=False,
+            pad_edge=False,
+            show_lines=False,
+        )
+        table.add_column("Title", style="cyan", no_wrap=False, overflow="ellipsis")
+        table.add_column("Year", style="green", width=6)
+        table.add_column("Rating", style="yellow", width=10)
+        table.add_column("TMDB ID", style="blue", width=10)
+
+        for item in items:
+            rating_str = ""
+            if item.rating:
+                rating_str = f"{_STARS[int(item.rating)]} {item.rating}"
+
+            tmdb_id = "-"
+            if item.provider_ids and item.provider_ids.tmdb_id:
+                tmdb_id = item.provider_ids.tmdb_id
+
+            table.add_row(
+                item.title,
+                str(item.year) if item.year else "-",
+                rating_str,
+                tmdb_id,
+            )
+
+        console.print(table)
+
+
 # Export for lazy loading
 cli = list_group
@@ -1,37 +1,81 @@
 """Status command - check connection status and show watchlist info."""
 
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import rich_click as click
 
-from ..core import with_database, with_plex, with_sonarr, with_radarr
+from ..core import with_database
 from ..display import console
+from ..services.plex import PlexService
+from ..services.radarr import RadarrService
+from ..services.sonarr import SonarrService
+from .common import print_connection_failure, print_connection_test
 
 
 @click.command()
 @click.pass_context
-@with_radarr(optional=True)
-@with_sonarr(optional=True)
-@with_plex
 @with_database
-def status(ctx, database, plex, sonarr, radarr):
+def status(ctx, database):
     """Check connection status and show watchlist info."""
-    config = ctx.obj.config
+    cfg_get = ctx.obj.config.get
+    session = ctx.obj.get_http_session()
+
+    # Build the enabled services up front so their probes can run concurrently;
+    # each probe is an independent HTTP round-trip dominated by RTT
+    plex_service = PlexService.from_config(ctx.obj.config, database, session=session)
+    sonarr_service = (
+        SonarrService.from_config(ctx.obj.config, session=session)
+        if cfg_get("sonarr.enabled", False)
+        else None
+    )
+    radarr_service = (
+        RadarrService.from_config(ctx.obj.config, session=session)
+        if cfg_get("radarr.enabled", False)
+        else None
+    )
+
+    print_connection_test("Plex, Sonarr and Radarr")
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        plex_future = pool.submit(plex_service.ping)
+        sonarr_future = pool.submit(sonarr_service.test_connection) if sonarr_service else None
+        radarr_future = pool.submit(radarr_service.test_connection) if radarr_service else None
+
+        plex_ok = plex_future.result()
+        sonarr_ok = sonarr_future.result() if sonarr_future else False
+        radarr_ok = radarr_future.result() if radarr_future else False
+
+    if not plex_ok:
+        print_connection_failure("Plex", "Check your token in config.yaml")
+        sys.exit(1)
 
     # Plex status
-    watchlist = plex.get_watchlist()
-    movies = sum(1 for item in watchlist if item.media_type.value == "movie")
-    shows = sum(1 for item in watchlist if item.media_type.value == "show")
+    with plex_service as plex:
+        watchlist = ctx.obj.get_watchlist_cached(plex)
+
+    # Count both media types in one pass instead of iterating the watchlist twice
+    counts = Counter(item.media_type.value for item in watchlist)
+    movies = counts.get("movie", 0)
+    shows = counts.get("show", 0)
     console.print(f"[green]✓[/green] Plex: Connected")
     console.print(f"  Watchlist: {len(watchlist)} items ({movies} movies, {shows} shows)")
 
     # Sonarr status
-    if sonarr:
-        console.print(f"\n[green]✓[/green] Sonarr: Connected ({config.get('sonarr.url')})")
+    if sonarr_service:
+        if sonarr_ok:
+            console.print(f"\n[green]✓[/green] Sonarr: Connected ({cfg_get('sonarr.url')})")
+        else:
+            print_connection_failure("Sonarr", "Check your URL and API key in config.yaml")
 
     # Radarr status
-    if radarr:
-        console.print(f"\n[green]✓[/green] Radarr: Connected ({config.get('radarr.url')})")
+    if radarr_service:
+        if radarr_ok:
+            console.print(f"\n[green]✓[/green] Radarr: Connected ({cfg_get('radarr.url')})")
+        else:
+            print_connection_failure("Radarr", "Check your URL and API key in config.yaml")
 
     # Database status
     db_path = Path(ctx.obj.db_path)
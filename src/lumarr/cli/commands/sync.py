@@ -3,7 +3,7 @@
 import rich_click as click
 
 from ...models import RequestStatus
-from ..core import with_database, with_plex, with_sonarr, with_radarr, with_tmdb, with_letterboxd, trigger_hook
+from ..core import with_database, with_plex, with_sonarr, with_radarr, with_tmdb, with_letterboxd, trigger_hook, trigger_hooks
 from ..display import console, format_sync_results
 from ..logic import establish_baseline, run_follow_mode, SyncManager
 from ..logic.follow_mode import _sync_letterboxd_items
@@ -50,12 +50,13 @@ def sync(ctx, database, plex, sonarr, radarr, tmdb, letterboxd_resolver, dry_run
     letterboxd.rss or letterboxd.watchlist.
     """
     config = ctx.obj.config
+    cfg_get = config.get  # Bind once; avoids re-walking ctx.obj.config per lookup
 
     # Trigger command start hook
     trigger_hook('command_start', command='sync', dry_run=dry_run)
 
     try:
-        if dry_run or config.get("sync.dry_run", False):
+        if dry_run or cfg_get("sync.dry_run", False):
             console.print("[yellow]Running in DRY RUN mode - no changes will be made[/yellow]\n")
             dry_run = True
 
@@ -100,8 +101,6 @@ def sync(ctx, database, plex, sonarr, radarr, tmdb, letterboxd_resolver, dry_run
         if (rss_names or watchlist_names) and radarr:
             letterboxd_summary = _sync_letterboxd_items(
                 letterboxd_resolver,
-                rss_names,
-                watchlist_names,
                 radarr,
                 database,
                 sync_manager,
@@ -114,22 +113,25 @@ def sync(ctx, database, plex, sonarr, radarr, tmdb, letterboxd_resolver, dry_run
         # Trigger sync complete hook
         total_added = plex_summary.movies_added + plex_summary.shows_added
         if letterboxd_summary:
-            total_added += letterboxd_summary['added']
-
-        trigger_hook(
-            'sync_complete',
-            total_added=total_added,
-            movies_added=plex_summary.movies_added + (letterboxd_summary['added'] if letterboxd_summary else 0),
-            shows_added=plex_summary.shows_added,
-            failed=plex_summary.failed + (letterboxd_summary['failed'] if letterboxd_summary else 0),
-        )
-
-        trigger_hook('command_end', command='sync', success=True)
+            total_added += letterboxd_summary.added
+
+        # Flush both lifecycle events in one dispatch pass
+        trigger_hooks([
+            ('sync_complete', {
+                'total_added': total_added,
+                'movies_added': plex_summary.movies_added + (letterboxd_summary.added if letterboxd_summary else 0),
+                'shows_added': plex_summary.shows_added,
+                'failed': plex_summary.failed + (letterboxd_summary.failed if letterboxd_summary else 0),
+            }),
+            ('command_end', {'command': 'sync', 'success': True}),
+        ])
 
     except Exception as e:
         console.print(f"[red]Error:[/red] {e}")
-        trigger_hook('sync_error', error=str(e))
-        trigger_hook('command_end', command='sync', success=False, error=str(e))
+        trigger_hooks([
+            ('sync_error', {'error': str(e)}),
+            ('command_end', {'command': 'sync', 'success': False, 'error': str(e)}),
+        ])
         raise
 
 
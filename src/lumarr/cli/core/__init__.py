@@ -16,7 +16,7 @@ from .exceptions import (
     ConnectionError,
     SyncError,
 )
-from .hooks import get_hook_manager, register_hook, trigger_hook
+from .hooks import get_hook_manager, register_hook, trigger_hook, trigger_hooks
 from .plugin_loader import LumarrGroup
 
 __all__ = [
@@ -39,6 +39,7 @@ __all__ = [
     "get_hook_manager",
     "register_hook",
     "trigger_hook",
+    "trigger_hooks",
     # Plugin loader
     "LumarrGroup",
 ]
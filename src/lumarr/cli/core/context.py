@@ -1,20 +1,105 @@
 """Application context for CLI."""
 
-from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 from ...config import Config
 
 
-@dataclass
 class LumarrContext:
-    """Shared application context passed through Click commands."""
+    """Shared application context passed through Click commands.
 
-    config: Config
-    config_path: Path
-    db_path: Path
-    database: Optional[any] = None  # Lazily initialized by decorators
+    Slotted rather than a dataclass: the instance is read on every
+    decorator wrapper (ctx.obj.config, ctx.obj.db_path, ...), and slots
+    keep those lookups off the instance __dict__. dataclass(slots=True)
+    would do the same but needs Python 3.10.
+    """
+
+    __slots__ = (
+        "config",
+        "config_path",
+        "db_path",
+        "database",
+        "http_session",
+        "watchlist_cache",
+        "letterboxd_cache",
+    )
+
+    def __init__(
+        self,
+        config: Config,
+        config_path: Path,
+        db_path: Path,
+        database: Optional[any] = None,
+        http_session: Optional[any] = None,
+        watchlist_cache: Optional[list] = None,
+        letterboxd_cache: Optional[list] = None,
+    ):
+        self.config = config
+        self.config_path = config_path
+        self.db_path = db_path
+        # Lazily initialized by decorators
+        self.database = database
+        # Lazily initialized shared requests.Session
+        self.http_session = http_session
+        # Watchlist snapshot shared by display commands
+        self.watchlist_cache = watchlist_cache
+        # Letterboxd items prefetched by list_group
+        self.letterboxd_cache = letterboxd_cache
+
+    def get_watchlist_cached(self, plex, force_refresh=False):
+        """
+        Return the Plex watchlist, reusing the snapshot from an earlier fetch
+        in this process.
+
+        Display commands (status, list) use this so chained or nested
+        invocations don't re-fetch an unchanged watchlist over HTTP. Sync
+        paths call plex.get_watchlist() directly since they need fresh data.
+
+        Args:
+            plex: PlexApi instance
+            force_refresh: Bypass both this snapshot and the metadata cache
+
+        Returns:
+            List of watchlist items
+        """
+        if force_refresh or self.watchlist_cache is None:
+            self.watchlist_cache = plex.get_watchlist(force_refresh=force_refresh)
+        return self.watchlist_cache
+
+    def get_http_session(self):
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        A single pooled session is reused by all API clients in a command
+        invocation so connections are kept alive across requests instead of
+        paying TCP/TLS handshake costs per client.
+
+        Returns:
+            Shared requests.Session with pooling and retry configured
+        """
+        if self.http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({"Accept-Encoding": "gzip"})
+            self.http_session = session
+        return self.http_session
 
     @classmethod
     def create(cls, config_path: str, db_path: Optional[str] = None):
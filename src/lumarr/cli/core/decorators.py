@@ -1,6 +1,6 @@
 """Dependency injection decorators for CLI commands."""
 
-from functools import wraps
+from functools import cache, wraps
 import sys
 
 import rich_click as click
@@ -14,6 +14,45 @@ from ..commands.common import (
 from .exceptions import ConnectionError
 
 
+# Cached lazy importers so each wrapper resolves its service class once per
+# process instead of re-executing the import statement on every invocation
+
+@cache
+def _database_service_cls():
+    from ..services.database import DatabaseService
+    return DatabaseService
+
+
+@cache
+def _plex_service_cls():
+    from ..services.plex import PlexService
+    return PlexService
+
+
+@cache
+def _sonarr_service_cls():
+    from ..services.sonarr import SonarrService
+    return SonarrService
+
+
+@cache
+def _radarr_service_cls():
+    from ..services.radarr import RadarrService
+    return RadarrService
+
+
+@cache
+def _tmdb_api_cls():
+    from ...api.tmdb import TmdbApi
+    return TmdbApi
+
+
+@cache
+def _letterboxd_resolver_cls():
+    from ..services.letterboxd import LetterboxdResolver
+    return LetterboxdResolver
+
+
 def with_config(f):
     """
     Inject config from context.
@@ -24,9 +63,8 @@ def with_config(f):
             pass
     """
     @wraps(f)
-    @click.pass_context
-    def wrapper(ctx, *args, **kwargs):
-        config = ctx.obj.config
+    def wrapper(*args, **kwargs):
+        config = click.get_current_context().obj.config
         return f(config=config, **kwargs)
     return wrapper
 
@@ -41,11 +79,9 @@ def with_database(f):
             pass
     """
     @wraps(f)
-    @click.pass_context
-    def wrapper(ctx, *args, **kwargs):
-        from ..services.database import DatabaseService
-
-        with DatabaseService(ctx.obj.db_path) as database:
+    def wrapper(*args, **kwargs):
+        ctx = click.get_current_context()
+        with _database_service_cls()(ctx.obj.db_path) as database:
             return f(ctx, database=database, **kwargs)
     return wrapper
 
@@ -60,16 +96,15 @@ def with_plex(f):
             pass
     """
     @wraps(f)
-    @click.pass_context
-    def wrapper(ctx, *args, **kwargs):
-        from ..services.plex import PlexService
-        from ..services.database import DatabaseService
-
+    def wrapper(*args, **kwargs):
+        ctx = click.get_current_context()
         print_connection_test("Plex")
 
         # Create database and Plex service in nested context managers
-        with DatabaseService(ctx.obj.db_path) as database:
-            plex_service = PlexService.from_config(ctx.obj.config, database)
+        with _database_service_cls()(ctx.obj.db_path) as database:
+            plex_service = _plex_service_cls().from_config(
+                ctx.obj.config, database, session=ctx.obj.get_http_session()
+            )
 
             with plex_service as plex:
                 if not plex.ping():
@@ -81,84 +116,69 @@ def with_plex(f):
     return wrapper
 
 
-def with_sonarr(optional=False):
-    """
-    Inject initialized and tested Sonarr API.
-
-    Args:
-        optional: If True, pass None if Sonarr is disabled. If False, exit on error.
-
-    Usage:
-        @with_sonarr(optional=True)
-        def command(sonarr, ...):
-            pass
+def _arr_decorator(service_name, get_service_cls, param_name):
     """
-    def decorator(f):
-        @wraps(f)
-        @click.pass_context
-        def wrapper(ctx, *args, **kwargs):
-            from ..services.sonarr import SonarrService
-
-            if not ctx.obj.config.get("sonarr.enabled", False):
-                if optional:
-                    return f(ctx, sonarr=None, **kwargs)
-                print_connection_failure("Sonarr", "Enable Sonarr in config.yaml")
-                sys.exit(1)
-
-            print_connection_test("Sonarr")
-            sonarr_service = SonarrService.from_config(ctx.obj.config)
-
-            with sonarr_service as sonarr:
-                if not sonarr.test_connection():
-                    print_connection_failure("Sonarr", "Check your URL and API key in config.yaml")
-                    if not optional:
-                        sys.exit(1)
-                    return f(ctx, sonarr=None, **kwargs)
-
-                print_connection_success("Sonarr")
-                return f(ctx, sonarr=sonarr, **kwargs)
-        return wrapper
-    return decorator
-
+    Build a with_sonarr/with_radarr style decorator factory.
 
-def with_radarr(optional=False):
-    """
-    Inject initialized and tested Radarr API.
+    The Sonarr and Radarr injection flows are identical except for names,
+    so both share this one code object instead of duplicating the
+    enabled-check / connect / test / inject chain per service.
 
     Args:
-        optional: If True, pass None if Radarr is disabled. If False, exit on error.
-
-    Usage:
-        @with_radarr(optional=True)
-        def command(radarr, ...):
-            pass
+        service_name: Display name used in connection messages
+        get_service_cls: Cached importer returning the service class
+        param_name: Config section and keyword-argument name (e.g. 'sonarr')
     """
-    def decorator(f):
-        @wraps(f)
-        @click.pass_context
-        def wrapper(ctx, *args, **kwargs):
-            from ..services.radarr import RadarrService
-
-            if not ctx.obj.config.get("radarr.enabled", False):
-                if optional:
-                    return f(ctx, radarr=None, **kwargs)
-                print_connection_failure("Radarr", "Enable Radarr in config.yaml")
-                sys.exit(1)
-
-            print_connection_test("Radarr")
-            radarr_service = RadarrService.from_config(ctx.obj.config)
-
-            with radarr_service as radarr:
-                if not radarr.test_connection():
-                    print_connection_failure("Radarr", "Check your URL and API key in config.yaml")
-                    if not optional:
-                        sys.exit(1)
-                    return f(ctx, radarr=None, **kwargs)
+    enabled_key = f"{param_name}.enabled"
+    enable_hint = f"Enable {service_name} in config.yaml"
+
+    def decorator_factory(optional=False):
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                ctx = click.get_current_context()
+                if not ctx.obj.config.get(enabled_key, False):
+                    if optional:
+                        kwargs[param_name] = None
+                        return f(ctx, **kwargs)
+                    print_connection_failure(service_name, enable_hint)
+                    sys.exit(1)
 
-                print_connection_success("Radarr")
-                return f(ctx, radarr=radarr, **kwargs)
-        return wrapper
-    return decorator
+                print_connection_test(service_name)
+                service = get_service_cls().from_config(
+                    ctx.obj.config, session=ctx.obj.get_http_session()
+                )
+
+                with service as api:
+                    if not api.test_connection():
+                        print_connection_failure(service_name, "Check your URL and API key in config.yaml")
+                        if not optional:
+                            sys.exit(1)
+                        kwargs[param_name] = None
+                        return f(ctx, **kwargs)
+
+                    print_connection_success(service_name)
+                    kwargs[param_name] = api
+                    return f(ctx, **kwargs)
+            return wrapper
+        return decorator
+
+    decorator_factory.__name__ = f"with_{param_name}"
+    decorator_factory.__doc__ = (
+        f"Inject initialized and tested {service_name} API.\n\n"
+        f"    Args:\n"
+        f"        optional: If True, pass None if {service_name} is disabled. "
+        f"If False, exit on error.\n\n"
+        f"    Usage:\n"
+        f"        @with_{param_name}(optional=True)\n"
+        f"        def command({param_name}, ...):\n"
+        f"            pass\n    "
+    )
+    return decorator_factory
+
+
+with_sonarr = _arr_decorator("Sonarr", _sonarr_service_cls, "sonarr")
+with_radarr = _arr_decorator("Radarr", _radarr_service_cls, "radarr")
 
 
 def with_tmdb(optional=True):
@@ -175,10 +195,8 @@ def with_tmdb(optional=True):
     """
     def decorator(f):
         @wraps(f)
-        @click.pass_context
-        def wrapper(ctx, *args, **kwargs):
-            from ...api.tmdb import TmdbApi
-
+        def wrapper(*args, **kwargs):
+            ctx = click.get_current_context()
             tmdb_key = ctx.obj.config.get("tmdb.api_key")
             if not tmdb_key:
                 if optional:
@@ -186,7 +204,9 @@ def with_tmdb(optional=True):
                 print_connection_failure("TMDB", "Add tmdb.api_key to config.yaml")
                 sys.exit(1)
 
-            tmdb = TmdbApi(api_key=tmdb_key)
+            tmdb = _tmdb_api_cls()(
+                api_key=tmdb_key, session=ctx.obj.get_http_session()
+            )
             if tmdb.is_configured():
                 print_connection_success("TMDB")
 
@@ -205,10 +225,8 @@ def with_letterboxd(f):
             pass
     """
     @wraps(f)
-    @click.pass_context
-    def wrapper(ctx, *args, **kwargs):
-        from ..services.letterboxd import LetterboxdResolver
-
-        resolver = LetterboxdResolver(ctx.obj.config)
+    def wrapper(*args, **kwargs):
+        ctx = click.get_current_context()
+        resolver = _letterboxd_resolver_cls()(ctx.obj.config)
         return f(ctx, letterboxd_resolver=resolver, **kwargs)
     return wrapper
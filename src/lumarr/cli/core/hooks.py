@@ -1,17 +1,23 @@
 """Simple event hook system for notifications and extensibility."""
 
 import logging
+import shlex
 import subprocess
 from typing import Callable, Dict, List, Any
 
 logger = logging.getLogger(__name__)
 
+# Characters whose presence means a hook command needs real shell semantics
+_SHELL_CHARS = frozenset("|&;<>()$`*?[]{}~#\\\n")
+
 
 class HookManager:
     """Manages event hooks for CLI notifications."""
 
     def __init__(self):
-        self._hooks: Dict[str, List[Callable]] = {}
+        # Values are tuples: registration is rare, triggering is hot, and
+        # tuples iterate compactly with no list-growth slack
+        self._hooks: Dict[str, tuple] = {}
 
     def register(self, event: str, callback: Callable):
         """
@@ -21,9 +27,7 @@ class HookManager:
             event: Event name (e.g., 'sync_complete', 'sync_error')
             callback: Function to call when event fires
         """
-        if event not in self._hooks:
-            self._hooks[event] = []
-        self._hooks[event].append(callback)
+        self._hooks[event] = self._hooks.get(event, ()) + (callback,)
         logger.debug(f"Registered hook for event: {event}")
 
     def trigger(self, event: str, **kwargs):
@@ -34,16 +38,36 @@ class HookManager:
             event: Event name
             **kwargs: Arguments to pass to callbacks
         """
-        if event not in self._hooks:
+        # Single dict-get; the common no-subscriber case returns immediately
+        callbacks = self._hooks.get(event)
+        if not callbacks:
             return
 
         logger.debug(f"Triggering event: {event}")
-        for callback in self._hooks[event]:
+        for callback in callbacks:
             try:
                 callback(**kwargs)
             except Exception as e:
                 logger.error(f"Hook callback failed for {event}: {e}")
 
+    def trigger_many(self, events):
+        """
+        Trigger a batch of events in one dispatch pass.
+
+        Short-circuits entirely when no hooks are registered — the common
+        case for installs without a hooks: config section — so callers can
+        fire several lifecycle events for the cost of one registry check.
+
+        Args:
+            events: Iterable of (event, payload) pairs; payload is passed
+                to callbacks as keyword arguments
+        """
+        if not self._hooks:
+            return
+
+        for event, payload in events:
+            self.trigger(event, **payload)
+
     def load_from_config(self, config):
         """
         Load hooks from configuration.
@@ -83,9 +107,30 @@ class HookManager:
 
     def _create_command_hook(self, command: str) -> Callable:
         """Create a command execution hook."""
+        # Pre-parse once at registration; spawning the argv directly skips
+        # the /bin/sh fork that shell=True pays on every fire. Commands using
+        # shell features (pipes, expansion, redirects) keep the shell path.
+        if _SHELL_CHARS.isdisjoint(command):
+            try:
+                argv = shlex.split(command)
+            except ValueError:
+                argv = None
+        else:
+            argv = None
+
         def hook(**kwargs):
             try:
-                subprocess.run(command, shell=True, check=False, capture_output=True)
+                if argv:
+                    # Fire and forget; output was discarded before, so skip
+                    # the capture pipes too
+                    subprocess.Popen(
+                        argv,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        close_fds=True,
+                    )
+                else:
+                    subprocess.run(command, shell=True, check=False, capture_output=True)
                 logger.debug(f"Executed hook command: {command}")
             except Exception as e:
                 logger.error(f"Failed to execute hook command: {e}")
@@ -93,13 +138,20 @@ class HookManager:
 
     def _create_webhook_hook(self, url: str) -> Callable:
         """Create a webhook HTTP POST hook."""
+        # Resolve the import once at registration and bind post directly in
+        # the closure; the availability check leaves the per-fire path
+        try:
+            from requests import post as _post
+        except ImportError:
+            _post = None
+
         def hook(**kwargs):
+            if _post is None:
+                logger.warning("requests library not installed, webhook skipped")
+                return
             try:
-                import requests
-                requests.post(url, json=kwargs, timeout=5)
+                _post(url, json=kwargs, timeout=5)
                 logger.debug(f"Sent webhook to: {url}")
-            except ImportError:
-                logger.warning("requests library not installed, webhook skipped")
             except Exception as e:
                 logger.error(f"Failed to send webhook: {e}")
         return hook
@@ -122,3 +174,8 @@ def register_hook(event: str, callback: Callable):
 def trigger_hook(event: str, **kwargs):
     """Convenience function to trigger a hook."""
     _hook_manager.trigger(event, **kwargs)
+
+
+def trigger_hooks(events):
+    """Convenience function to trigger a batch of (event, payload) pairs."""
+    _hook_manager.trigger_many(events)
@@ -14,39 +14,57 @@ class LazyCommandGroup(click.Group):
     def __init__(self, *args, commands_package: str = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.commands_package = commands_package or 'lumarr.cli.commands'
+        # Discovery cache; the commands package never changes after __init__
+        # and manual registrations happen at import time, before first use
+        self._listed_commands: Optional[list] = None
+        # Canonical command name -> module basename, filled by the same scan
+        self._name_to_module: Optional[dict] = None
 
     def list_commands(self, ctx):
         """
         List all available commands by discovering Python files and registered commands.
 
+        The directory scan runs once per process; help rendering and shell
+        completion reuse the cached listing.
+
         Returns:
             List of command names
         """
+        if self._listed_commands is not None:
+            return self._listed_commands
+
         rv = []
+        name_to_module = {}
 
         # Get lazy-loaded commands from the commands directory
         try:
             package = importlib.import_module(self.commands_package)
             commands_dir = os.path.dirname(package.__file__)
 
-            for filename in os.listdir(commands_dir):
+            # scandir over listdir: names come from the directory entries
+            # without a stat call per file
+            for entry in os.scandir(commands_dir):
+                filename = entry.name
                 if filename.endswith('.py') and not filename.startswith('__'):
-                    # Remove .py and _cmd suffix if present
-                    cmd_name = filename[:-3]
-                    if cmd_name.endswith('_cmd'):
-                        cmd_name = cmd_name[:-4]
+                    # Strip .py and an optional _cmd suffix in one pass each
+                    module_name = filename.removesuffix('.py')
+                    cmd_name = module_name.removesuffix('_cmd')
                     rv.append(cmd_name)
+                    name_to_module[cmd_name] = module_name
 
         except (ImportError, AttributeError, FileNotFoundError):
             pass
 
-        # Add manually registered commands (like groups)
-        if hasattr(self, 'commands') and self.commands:
+        # Add manually registered commands (like groups); click.Group.__init__
+        # always sets self.commands, so no attribute guard is needed
+        if self.commands:
             for name in self.commands.keys():
                 if name not in rv:
                     rv.append(name)
 
         rv.sort()
+        self._listed_commands = rv
+        self._name_to_module = name_to_module
         return rv
 
     def get_command(self, ctx, name):
@@ -61,10 +79,25 @@ class LazyCommandGroup(click.Group):
             Click command or None if not found
         """
         # First check if it's a manually registered command (like groups)
-        if hasattr(self, 'commands') and name in self.commands:
+        if name in self.commands:
             return self.commands[name]
 
-        # Try multiple possible module names for lazy-loaded commands
+        # Look the module up in the map built by the discovery scan so the
+        # common path is a single import with no ImportError probing
+        if self._name_to_module is None:
+            self.list_commands(ctx)
+        module_name = self._name_to_module.get(name)
+        if module_name is not None:
+            try:
+                mod = importlib.import_module(f'{self.commands_package}.{module_name}')
+            except ImportError:
+                return None
+            cmd = getattr(mod, 'cli', None) or getattr(mod, name, None)
+            if cmd:
+                return cmd
+
+        # Fall back to probing module-name variants for commands that the
+        # scan didn't see (e.g. namespace oddities)
         possible_names = [name, f"{name}_cmd", f"cmd_{name}"]
 
         for module_name in possible_names:
@@ -80,6 +113,20 @@ class LazyCommandGroup(click.Group):
         return None
 
 
+# One-line help for the lazy-loaded commands, so rendering --help doesn't
+# import every command module just to read its docstring. Keep in sync with
+# the command docstrings in lumarr/cli/commands/; unknown names fall back to
+# importing the module.
+_CMD_HELP_CACHE = {
+    'clear': 'Clear sync history database.',
+    'config': 'Interactive configuration wizard.',
+    'history': 'Show sync history.',
+    'list': 'List items from Plex watchlist and Letterboxd.',
+    'status': 'Check connection status and show watchlist info.',
+    'sync': 'Sync Plex watchlist and Letterboxd items to Sonarr and Radarr.',
+}
+
+
 class AliasedGroup(click.Group):
     """Group that supports command aliases."""
 
@@ -117,16 +164,25 @@ class AliasedGroup(click.Group):
         """
         commands = []
         for subcommand in self.list_commands(ctx):
-            cmd = self.get_command(ctx, subcommand)
-            if cmd is None:
-                continue
+            # Registered commands (like the sonarr/radarr groups) are already
+            # live objects; for lazy ones prefer the static help cache so the
+            # module isn't imported just to render one line
+            cmd = self.commands.get(subcommand)
+            if cmd is not None:
+                help_text = cmd.get_short_help_str(limit=formatter.width)
+            else:
+                help_text = _CMD_HELP_CACHE.get(subcommand)
+                if help_text is None:
+                    cmd = self.get_command(ctx, subcommand)
+                    if cmd is None:
+                        continue
+                    help_text = cmd.get_short_help_str(limit=formatter.width)
 
             # Find aliases for this command
             aliases = [alias for alias, target in self.aliases.items() if target == subcommand]
             if aliases:
                 subcommand = f"{subcommand} ({', '.join(aliases)})"
 
-            help_text = cmd.get_short_help_str(limit=formatter.width)
             commands.append((subcommand, help_text))
 
         if commands:
@@ -142,10 +198,15 @@ def _store_global_option(ctx, param, value):
     The actual value handling is done by expose_value=False.
     """
     if value is not None and not ctx.resilient_parsing:
-        # Find the root context (main cli group)
-        root_ctx = ctx
-        while root_ctx.parent is not None:
-            root_ctx = root_ctx.parent
+        # Find the root context (main cli group); ctx.meta is shared across
+        # the context tree, so the walk happens once per invocation even
+        # though both global options land in this callback
+        root_ctx = ctx.meta.get("_lumarr_root")
+        if root_ctx is None:
+            root_ctx = ctx
+            while root_ctx.parent is not None:
+                root_ctx = root_ctx.parent
+            ctx.meta["_lumarr_root"] = root_ctx
 
         # Store value in root context's params for main cli() to process
         if param.name not in root_ctx.params:
@@ -185,12 +246,47 @@ class LumarrGroup(LazyCommandGroup, AliasedGroup, RichGroup):
     ]
 
     def __init__(self, *args, commands_package: str = None, aliases: Optional[dict] = None, **kwargs):
-        # Initialize both parent classes
-        LazyCommandGroup.__init__(self, *args, commands_package=commands_package, **kwargs)
-        AliasedGroup.__init__(self, *args, aliases=aliases, **kwargs)
+        # Cooperative MRO init: LazyCommandGroup and AliasedGroup each consume
+        # their keyword and chain up, so click.Group.__init__ runs exactly once
+        super().__init__(*args, commands_package=commands_package, aliases=aliases, **kwargs)
+        # Fully-prepared commands keyed by requested name; click commands are
+        # effectively immutable once built, so dispatch becomes a dict lookup
+        self._cmd_cache: dict = {}
+        # Lightweight stand-ins served while rendering help (see format_help)
+        self._help_stubs: dict = {}
+        self._rendering_help = False
+
+    def format_help(self, ctx, formatter):
+        """Render help, serving stub commands for lazy modules.
+
+        rich-click's help renderer calls get_command for every listed name
+        just to read one line of short help, which would import every
+        command module. While this flag is set, get_command answers from
+        the static help cache with a stub instead.
+        """
+        self._rendering_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._rendering_help = False
 
     def get_command(self, ctx, cmd_name):
         """Get command with alias resolution, lazy loading, and global options."""
+        cmd = self._cmd_cache.get(cmd_name)
+        if cmd is not None:
+            return cmd
+
+        # Help rendering only needs the one-line description; answer from
+        # the static cache without importing the command module
+        if self._rendering_help and cmd_name not in self.commands:
+            help_text = _CMD_HELP_CACHE.get(cmd_name)
+            if help_text is not None:
+                stub = self._help_stubs.get(cmd_name)
+                if stub is None:
+                    stub = click.Command(cmd_name, help=help_text, short_help=help_text)
+                    self._help_stubs[cmd_name] = stub
+                return stub
+
         # First resolve alias
         resolved_name = self.aliases.get(cmd_name, cmd_name)
         # Then lazy load
@@ -199,6 +295,9 @@ class LumarrGroup(LazyCommandGroup, AliasedGroup, RichGroup):
         # Inject global options into the command
         if cmd is not None:
             cmd = self._add_global_options(cmd)
+            # Cache under both spellings so alias hits skip resolution too
+            self._cmd_cache[cmd_name] = cmd
+            self._cmd_cache[resolved_name] = cmd
 
         return cmd
 
@@ -212,17 +311,27 @@ class LumarrGroup(LazyCommandGroup, AliasedGroup, RichGroup):
         Returns:
             Command with global options added
         """
-        for global_opt in self.GLOBAL_OPTIONS:
-            # Check if option already exists on the command
-            option_exists = any(
-                p.name == global_opt.name for p in cmd.params
-            )
+        # Already processed on an earlier dispatch; skip the params scan
+        if getattr(cmd, '_lumarr_globals_added', False):
+            return cmd
 
-            if not option_exists:
-                # Insert at beginning so they appear after command-specific options in help
-                cmd.params.insert(0, global_opt)
+        # One pass over params instead of an any() scan per global option
+        existing = {p.name for p in cmd.params}
+        missing = _GLOBAL_OPTION_NAMES - existing
+        if missing:
+            for global_opt in self.GLOBAL_OPTIONS:
+                if global_opt.name in missing:
+                    # Insert at beginning so they appear after command-specific options in help
+                    cmd.params.insert(0, global_opt)
+
+        cmd._lumarr_globals_added = True
 
         # RichGroup handles formatting automatically - no need to override
         return cmd
 
     # Let RichGroup handle formatting - it provides beautiful output by default
+
+
+# Global option names precomputed once; _add_global_options diffs against
+# these instead of rescanning GLOBAL_OPTIONS per command param
+_GLOBAL_OPTION_NAMES = frozenset(opt.name for opt in LumarrGroup.GLOBAL_OPTIONS)
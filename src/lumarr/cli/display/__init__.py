@@ -3,10 +3,12 @@
 from .console import console
 from .formatters import format_sync_results
 from .tables import (
+    _render_folders_table,
     _render_history_table,
     _render_letterboxd_results_table,
-    _render_service_info_table,
+    _render_profiles_table,
     _render_sync_results_table,
+    _render_tags_table,
     _render_watchlist_table,
 )
 
@@ -17,5 +19,7 @@ __all__ = [
     "_render_letterboxd_results_table",
     "_render_history_table",
     "_render_watchlist_table",
-    "_render_service_info_table",
+    "_render_profiles_table",
+    "_render_folders_table",
+    "_render_tags_table",
 ]
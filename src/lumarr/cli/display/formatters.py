@@ -10,7 +10,7 @@ def format_sync_results(plex_summary, letterboxd_summary=None):
 
     Args:
         plex_summary: Plex sync summary object
-        letterboxd_summary: Letterboxd sync summary dict (optional)
+        letterboxd_summary: LetterboxdSyncSummary (optional)
     """
     # Plex results table
     if plex_summary.results:
@@ -18,24 +18,31 @@ def format_sync_results(plex_summary, letterboxd_summary=None):
         console.print(table)
 
     # Letterboxd results table
-    if letterboxd_summary and letterboxd_summary.get("results"):
+    if letterboxd_summary and letterboxd_summary.results:
         table = _render_letterboxd_results_table(
-            letterboxd_summary["results"], title="Letterboxd Sync Results"
+            letterboxd_summary.results, title="Letterboxd Sync Results"
         )
         console.print(table)
 
-    # Combined summary
-    console.print(f"\n[bold]Summary:[/bold]")
-    console.print(f"  [dim]Plex:[/dim]")
-    console.print(f"    Total items: {plex_summary.total}")
-    console.print(f"    Movies added: [green]{plex_summary.movies_added}[/green]")
-    console.print(f"    Shows added: [green]{plex_summary.shows_added}[/green]")
-    console.print(f"    Skipped: [yellow]{plex_summary.skipped}[/yellow]")
-    console.print(f"    Failed: [red]{plex_summary.failed}[/red]")
+    # Combined summary, emitted as one print so the block costs a single
+    # render/flush instead of one per line
+    lines = [
+        "\n[bold]Summary:[/bold]",
+        "  [dim]Plex:[/dim]",
+        f"    Total items: {plex_summary.total}",
+        f"    Movies added: [green]{plex_summary.movies_added}[/green]",
+        f"    Shows added: [green]{plex_summary.shows_added}[/green]",
+        f"    Skipped: [yellow]{plex_summary.skipped}[/yellow]",
+        f"    Failed: [red]{plex_summary.failed}[/red]",
+    ]
 
     if letterboxd_summary:
-        console.print(f"  [dim]Letterboxd:[/dim]")
-        console.print(f"    Total items: {letterboxd_summary['total']}")
-        console.print(f"    Movies added: [green]{letterboxd_summary['added']}[/green]")
-        console.print(f"    Skipped: [yellow]{letterboxd_summary['skipped']}[/yellow]")
-        console.print(f"    Failed: [red]{letterboxd_summary['failed']}[/red]")
+        lines += [
+            "  [dim]Letterboxd:[/dim]",
+            f"    Total items: {letterboxd_summary.total}",
+            f"    Movies added: [green]{letterboxd_summary.added}[/green]",
+            f"    Skipped: [yellow]{letterboxd_summary.skipped}[/yellow]",
+            f"    Failed: [red]{letterboxd_summary.failed}[/red]",
+        ]
+
+    console.print("\n".join(lines))
@@ -7,10 +7,25 @@ Following mtm design patterns:
 - Sorted output where applicable
 """
 
+from datetime import datetime
+
 from rich.table import Table
 
 from ...models import RequestStatus
 
+# Status -> color maps hoisted out of the render loops so large tables
+# don't rebuild the same dict literal once per row
+_STATUS_STYLES_ENUM = {
+    RequestStatus.SUCCESS: "green",
+    RequestStatus.FAILED: "red",
+    RequestStatus.SKIPPED: "yellow",
+}
+_STATUS_STYLES_STR = {
+    "success": "green",
+    "failed": "red",
+    "skipped": "yellow",
+}
+
 
 def _render_sync_results_table(results, title="Sync Results"):
     """
@@ -31,11 +46,7 @@ def _render_sync_results_table(results, title="Sync Results"):
     table.add_column("Message")
 
     for result in results:
-        status_style = {
-            RequestStatus.SUCCESS: "green",
-            RequestStatus.FAILED: "red",
-            RequestStatus.SKIPPED: "yellow",
-        }.get(result.status, "white")
+        status_style = _STATUS_STYLES_ENUM.get(result.status, "white")
 
         table.add_row(
             result.item.title,
@@ -53,7 +64,7 @@ def _render_letterboxd_results_table(results, title="Letterboxd Sync Results"):
     Create table for Letterboxd sync results.
 
     Args:
-        results: List of result dictionaries
+        results: List of LetterboxdSyncResult objects
         title: Table title
 
     Returns:
@@ -67,18 +78,14 @@ def _render_letterboxd_results_table(results, title="Letterboxd Sync Results"):
     table.add_column("Message")
 
     for result in results:
-        status_style = {
-            RequestStatus.SUCCESS: "green",
-            RequestStatus.FAILED: "red",
-            RequestStatus.SKIPPED: "yellow",
-        }.get(result["status"], "white")
+        status_style = _STATUS_STYLES_ENUM.get(result.status, "white")
 
         table.add_row(
-            result["item"].title,
-            str(result["item"].year) if result["item"].year else "N/A",
+            result.item.title,
+            str(result.item.year) if result.item.year else "N/A",
             "radarr",
-            f"[{status_style}]{result['status'].value.upper()}[/{status_style}]",
-            result["message"],
+            f"[{status_style}]{result.status.value.upper()}[/{status_style}]",
+            result.message,
         )
 
     return table
@@ -89,7 +96,7 @@ def _render_history_table(records, limit):
     Create table for sync history.
 
     Args:
-        records: List of history records from database
+        records: Iterable of history records from database
         limit: Number of records shown
 
     Returns:
@@ -103,13 +110,15 @@ def _render_history_table(records, limit):
     table.add_column("Status")
 
     for record in records:
-        status_style = {
-            "success": "green",
-            "failed": "red",
-            "skipped": "yellow",
-        }.get(record["status"], "white")
+        status_style = _STATUS_STYLES_STR.get(record["status"], "white")
 
-        synced_at = record["synced_at"].split("T")[0] if "T" in record["synced_at"] else record["synced_at"]
+        # synced_at is epoch seconds; rows from before the integer
+        # switch may still be ISO text
+        raw = record["synced_at"]
+        if isinstance(raw, str):
+            synced_at = raw.split("T")[0] if "T" in raw else raw
+        else:
+            synced_at = datetime.fromtimestamp(raw).strftime("%Y-%m-%d")
 
         table.add_row(
             synced_at,
@@ -136,12 +145,20 @@ def _render_watchlist_table(items, detailed=False):
     if detailed:
         return None  # Detailed view doesn't use tables
 
-    table = Table(show_header=True, header_style="bold cyan")
-    table.add_column("Title", style="bold", no_wrap=False, width=30)
+    # Fixed widths plus expand/pad tuning keep Rich from re-measuring layout
+    # per row on large watchlists
+    table = Table(
+        show_header=True,
+        header_style="bold cyan",
+        expand=False,
+        pad_edge=False,
+        show_lines=False,
+    )
+    table.add_column("Title", style="bold", no_wrap=False, width=30, overflow="ellipsis")
     table.add_column("Type", style="blue", width=6)
     table.add_column("Year", style="green", width=6)
     table.add_column("Rating", style="yellow", width=8)
-    table.add_column("Genres", style="magenta", no_wrap=False, width=25)
+    table.add_column("Genres", style="magenta", no_wrap=False, width=25, overflow="ellipsis")
     table.add_column("IDs", style="white", width=20)
 
     for item in items:
@@ -170,56 +187,98 @@ def _render_watchlist_table(items, detailed=False):
     return table
 
 
-def _render_service_info_table(profiles=None, folders=None, tags=None):
+# Precomputed 1 / 1024**3 so free-space conversion is a single multiply per row
+_BYTES_TO_GB = 9.313225746154785e-10
+
+
+def _render_kv_table(columns, rows):
     """
-    Create tables for Sonarr/Radarr service info.
+    Create a table from precomputed string rows.
 
     Args:
-        profiles: List of quality profiles
-        folders: List of root folders
-        tags: List of tags
+        columns: List of (name, style kwargs) tuples for add_column
+        rows: List of string tuples, one per row
 
     Returns:
-        Tuple of (profiles_table, folders_table, tags_table)
+        Rich Table object
     """
-    profiles_table = folders_table = tags_table = None
+    table = Table(
+        show_header=True,
+        header_style="bold cyan",
+        expand=False,
+        pad_edge=False,
+        show_lines=False,
+    )
+    for name, kwargs in columns:
+        table.add_column(name, **kwargs)
+
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    if profiles:
-        profiles_table = Table(show_header=True, header_style="bold cyan")
-        profiles_table.add_column("ID", style="bold", width=8)
-        profiles_table.add_column("Name", style="white")
+    return table
 
-        for profile in profiles:
-            profiles_table.add_row(
-                str(profile.get("id", "")),
-                profile.get("name", ""),
-            )
 
-    if folders:
-        folders_table = Table(show_header=True, header_style="bold cyan")
-        folders_table.add_column("ID", style="bold", width=8)
-        folders_table.add_column("Path", style="white")
-        folders_table.add_column("Free Space", style="green")
+def _render_profiles_table(profiles):
+    """
+    Create table for Sonarr/Radarr quality profiles.
 
-        for folder in folders:
-            free_space = folder.get("freeSpace", 0)
-            free_space_gb = free_space / (1024**3) if free_space else 0
+    Args:
+        profiles: List of quality profiles
 
-            folders_table.add_row(
-                str(folder.get("id", "")),
-                folder.get("path", ""),
-                f"{free_space_gb:.1f} GB",
-            )
+    Returns:
+        Rich Table object, or None if there are no profiles
+    """
+    if not profiles:
+        return None
+    return _render_kv_table(
+        [("ID", {"style": "bold", "width": 8}), ("Name", {"style": "white"})],
+        [(str(p.get("id", "")), p.get("name", "")) for p in profiles],
+    )
 
-    if tags:
-        tags_table = Table(show_header=True, header_style="bold cyan")
-        tags_table.add_column("ID", style="bold", width=8)
-        tags_table.add_column("Label", style="white")
 
-        for tag in tags:
-            tags_table.add_row(
-                str(tag.get("id", "")),
-                tag.get("label", ""),
+def _render_folders_table(folders):
+    """
+    Create table for Sonarr/Radarr root folders.
+
+    Args:
+        folders: List of root folders
+
+    Returns:
+        Rich Table object, or None if there are no folders
+    """
+    if not folders:
+        return None
+    return _render_kv_table(
+        [
+            ("ID", {"style": "bold", "width": 8}),
+            ("Path", {"style": "white"}),
+            ("Free Space", {"style": "green"}),
+        ],
+        [
+            (
+                str(f.get("id", "")),
+                f.get("path", ""),
+                f"{(f.get('freeSpace') or 0) * _BYTES_TO_GB:.1f} GB",
             )
+            for f in folders
+        ],
+    )
 
-    return profiles_table, folders_table, tags_table
+
+def _render_tags_table(tags):
+    """
+    Create table for Sonarr/Radarr tags.
+
+    Args:
+        tags: List of tags
+
+    Returns:
+        Rich Table object, or None if there are no tags
+    """
+    if not tags:
+        return None
+    return _render_kv_table(
+        [("ID", {"style": "bold", "width": 8}), ("Label", {"style": "white"})],
+        [(str(t.get("id", "")), t.get("label", "")) for t in tags],
+    )
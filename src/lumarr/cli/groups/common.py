@@ -0,0 +1,107 @@
+"""Shared helpers for Sonarr/Radarr command groups."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ..commands.common import normalize_service_url
+from ..display import (
+    console,
+    _render_folders_table,
+    _render_profiles_table,
+    _render_tags_table,
+)
+
+
+def _arr_info(service_name, api_cls, api_error_cls, url, api_key):
+    """
+    Show service configuration information (quality profiles, root folders, tags).
+
+    Sonarr and Radarr expose identical endpoints for this data, so a single
+    implementation serves both `sonarr info` and `radarr info`.
+
+    Args:
+        service_name: Display name ("Sonarr" or "Radarr")
+        api_cls: API client class (SonarrApi or RadarrApi)
+        api_error_cls: API error class raised by the client
+        url: Resolved service URL (flag or config)
+        api_key: Resolved API key (flag or config)
+    """
+    if not url or not api_key:
+        console.print(
+            f"[red]Error:[/red] {service_name} URL and API key required.\n"
+            "Provide via --url and --api-key flags or configure in config.yaml"
+        )
+        sys.exit(1)
+
+    # Normalize URL to handle formats like "192.168.2.2:4019"
+    url = normalize_service_url(url)
+
+    try:
+        api = api_cls(
+            url=url,
+            api_key=api_key,
+            quality_profile=1,
+            root_folder="/",
+        )
+
+        console.print(f"[cyan]Connecting to {service_name}...[/cyan]")
+        if not api.test_connection():
+            console.print(
+                f"[red]Failed to connect to {service_name}. Check your URL and API key.[/red]"
+            )
+            sys.exit(1)
+
+        console.print(f"[green]✓[/green] Connected to {service_name} at {url}\n")
+
+        # The three endpoints are independent GETs against the same host;
+        # fetch them concurrently so the wall time is the slowest round
+        # trip, not the sum. Rendering stays sequential below.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            profiles_future = pool.submit(api.get_quality_profiles)
+            folders_future = pool.submit(api.get_root_folders)
+            tags_future = pool.submit(api.get_tags)
+
+            quality_profiles = profiles_future.result()
+            root_folders = folders_future.result()
+            tags = tags_future.result()
+
+        # Display quality profiles
+        console.print("[bold cyan]Quality Profiles[/bold cyan]")
+        console.print("[dim]Use these IDs for the 'quality_profile' setting in config.yaml[/dim]\n")
+
+        profiles_table = _render_profiles_table(quality_profiles)
+        if profiles_table:
+            console.print(profiles_table)
+        else:
+            console.print("[yellow]No quality profiles found[/yellow]")
+
+        console.print()
+
+        # Display root folders
+        console.print("[bold cyan]Root Folders[/bold cyan]")
+        console.print("[dim]Use these paths for the 'root_folder' setting in config.yaml[/dim]\n")
+
+        folders_table = _render_folders_table(root_folders)
+        if folders_table:
+            console.print(folders_table)
+        else:
+            console.print("[yellow]No root folders found[/yellow]")
+
+        console.print()
+
+        # Display tags
+        if tags:
+            console.print("[bold cyan]Tags[/bold cyan]")
+            console.print("[dim]Available tags for advanced configuration[/dim]\n")
+
+            tags_table = _render_tags_table(tags)
+            if tags_table:
+                console.print(tags_table)
+            console.print()
+
+    except api_error_cls as e:
+        console.print(f"[red]{service_name} API Error:[/red] {e}")
+        sys.exit(1)
+    except Exception as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
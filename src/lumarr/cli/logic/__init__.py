@@ -1,11 +1,25 @@
-"""Business logic layer."""
+"""Business logic layer.
 
-from .baseline import establish_baseline
-from .follow_mode import run_follow_mode
-from .sync_manager import SyncManager
+Lazily imported (PEP 562) for the same reason as the services package:
+these modules pull in the api clients, which commands that never sync
+should not pay for.
+"""
 
-__all__ = [
-    "establish_baseline",
-    "run_follow_mode",
-    "SyncManager",
-]
+import importlib
+
+_LAZY = {
+    "establish_baseline": ".baseline",
+    "run_follow_mode": ".follow_mode",
+    "SyncManager": ".sync_manager",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,38 @@
 """Baseline establishment logic for --ignore-existing flag."""
 
-import builtins
 import logging
+from datetime import datetime, timedelta
+from itertools import chain
 
 from ...api.letterboxd import LetterboxdApi, LetterboxdApiError
-from ...models import MediaType, RequestStatus
+from ...models import MediaType, RequestStatus, dedup_by_rating_key
 from ..display.console import console
 
 logger = logging.getLogger(__name__)
 
+# How long a per-username Letterboxd baseline stays fresh; re-baselining
+# within this window would just re-fetch the same feeds to mark the same
+# items as synced
+BASELINE_MAX_AGE_HOURS = 24
+
+
+def _baseline_is_current(database, baseline_keys):
+    """Check whether every (kind, key) pair was baselined recently.
+
+    Args:
+        database: Database instance
+        baseline_keys: List of (kind, key) tuples to check
+
+    Returns:
+        True if all keys have a baseline newer than BASELINE_MAX_AGE_HOURS
+    """
+    cutoff = datetime.now() - timedelta(hours=BASELINE_MAX_AGE_HOURS)
+    for kind, key in baseline_keys:
+        completed_at = database.get_baseline_timestamp(kind, key)
+        if completed_at is None or completed_at < cutoff:
+            return False
+    return True
+
 
 def establish_baseline(database, plex, sonarr, radarr, letterboxd_resolver, force_refresh=False):
     """
@@ -45,32 +69,47 @@ def establish_baseline(database, plex, sonarr, radarr, letterboxd_resolver, forc
     watchlist = plex.get_watchlist(force_refresh=force_refresh)
     summary["plex_total"] = len(watchlist)
 
+    # One batched query per service instead of one is_synced round trip per item
+    synced_movies = database.get_synced_set(
+        [i.rating_key for i in watchlist if i.media_type == MediaType.MOVIE], "radarr"
+    )
+    synced_shows = database.get_synced_set(
+        [i.rating_key for i in watchlist if i.media_type == MediaType.TV_SHOW], "sonarr"
+    )
+
+    # Collect rows and flush once: one transaction instead of one commit per item
+    plex_rows = []
     for item in watchlist:
         # Determine target service based on media type
         if item.media_type == MediaType.MOVIE and radarr:
             target_service = "radarr"
+            already_synced = item.rating_key in synced_movies
         elif item.media_type == MediaType.TV_SHOW and sonarr:
             target_service = "sonarr"
+            already_synced = item.rating_key in synced_shows
         else:
             summary["plex_skipped"] += 1
             continue
 
         # Mark as synced if not already marked
-        if not database.is_synced(item.rating_key, target_service):
-            database.record_sync(
-                rating_key=item.rating_key,
-                title=item.title,
-                media_type=item.media_type,
-                target_service=target_service,
-                status=RequestStatus.SUCCESS,
-                tmdb_id=item.provider_ids.tmdb_id,
-                tvdb_id=item.provider_ids.tvdb_id,
-                imdb_id=item.provider_ids.imdb_id,
-            )
+        if not already_synced:
+            plex_rows.append((
+                item.rating_key,
+                item.title,
+                item.media_type.value,
+                item.provider_ids.tmdb_id,
+                item.provider_ids.tvdb_id,
+                item.provider_ids.imdb_id,
+                target_service,
+                RequestStatus.SUCCESS.value,
+                None,
+            ))
             summary["plex_marked"] += 1
         else:
             summary["plex_already_synced"] += 1
 
+    database.record_sync_many(plex_rows)
+
     console.print(
         f"  Plex: Marked {summary['plex_marked']} new, "
         f"{summary['plex_already_synced']} already synced, "
@@ -81,53 +120,83 @@ def establish_baseline(database, plex, sonarr, radarr, letterboxd_resolver, forc
     rss_names = letterboxd_resolver.resolve_rss_usernames()
     watchlist_names = letterboxd_resolver.resolve_watchlist_usernames()
 
+    baseline_keys = []
     if (rss_names or watchlist_names) and radarr:
+        # Skip the fetch entirely when every username was already baselined
+        # recently; re-running --ignore-existing back to back otherwise pays
+        # for the full feed/scrape round trips just to mark the same items
+        baseline_keys = [("letterboxd_rss", name) for name in rss_names]
+        baseline_keys += [("letterboxd_watchlist", name) for name in watchlist_names]
+        if not force_refresh and _baseline_is_current(database, baseline_keys):
+            console.print(
+                "[cyan]Letterboxd baseline already current, skipping fetch[/cyan]"
+            )
+            baseline_keys = []
+
+    if baseline_keys:
         console.print("[cyan]Processing Letterboxd items...[/cyan]")
         try:
             letterboxd = LetterboxdApi(
                 usernames=rss_names,
                 watchlist_usernames=watchlist_names,
+                database=database,
+                force_refresh=force_refresh,
+                session=plex.session,
             )
 
-            lbox_items = []
+            sources = []
             if rss_names:
-                lbox_items.extend(letterboxd.get_watched_movies(rss_names))
+                sources.append(letterboxd.get_watched_movies(rss_names))
             if watchlist_names:
-                lbox_items.extend(letterboxd.get_watchlist_movies(watchlist_names))
+                sources.append(letterboxd.get_watchlist_movies(watchlist_names))
 
-            # Deduplicate
-            unique_lbox = {}
-            for item in lbox_items:
-                unique_lbox[item.rating_key] = item
-            lbox_items = builtins.list(unique_lbox.values())
+            # Deduplicate in one pass over the chained sources
+            lbox_items = list(dedup_by_rating_key(chain.from_iterable(sources)))
 
             summary["letterboxd_total"] = len(lbox_items)
 
+            synced_lbox = database.get_synced_set(
+                [i.rating_key for i in lbox_items], "radarr"
+            )
+
+            metadata_rows = []
+            lbox_rows = []
             for item in lbox_items:
                 # Store Letterboxd metadata without fetching TMDB ID
                 if item.letterboxd_id and item.letterboxd_slug:
-                    database.set_letterboxd_metadata(
-                        letterboxd_id=item.letterboxd_id,
-                        slug=item.letterboxd_slug,
-                        title=item.title,
-                        year=item.year,
-                        tmdb_id=None,  # Don't fetch during baseline
-                    )
-
-                if not database.is_synced(item.rating_key, "radarr"):
-                    database.record_sync(
-                        rating_key=item.rating_key,
-                        title=item.title,
-                        media_type=MediaType.MOVIE,
-                        target_service="radarr",
-                        status=RequestStatus.SUCCESS,
-                        tmdb_id=None,  # No TMDB ID during baseline
-                        imdb_id=None,
-                    )
+                    metadata_rows.append((
+                        item.letterboxd_id,
+                        item.letterboxd_slug,
+                        None,  # Don't fetch TMDB ID during baseline
+                        item.title,
+                        item.year,
+                    ))
+
+                if item.rating_key not in synced_lbox:
+                    lbox_rows.append((
+                        item.rating_key,
+                        item.title,
+                        MediaType.MOVIE.value,
+                        None,  # No TMDB ID during baseline
+                        None,
+                        None,
+                        "radarr",
+                        RequestStatus.SUCCESS.value,
+                        None,
+                    ))
                     summary["letterboxd_marked"] += 1
                 else:
                     summary["letterboxd_already_synced"] += 1
 
+            # attempted=False: no TMDB lookup happened for these rows, so
+            # fetched_at stays NULL and later syncs still try the fetch
+            database.set_letterboxd_metadata_many(metadata_rows, attempted=False)
+            database.record_sync_many(lbox_rows)
+
+            # Only stamp usernames once their items are actually recorded
+            for kind, key in baseline_keys:
+                database.set_baseline_timestamp(kind, key)
+
             console.print(
                 f"  Letterboxd: Marked {summary['letterboxd_marked']} new, "
                 f"{summary['letterboxd_already_synced']} already synced, "
@@ -137,7 +206,9 @@ def establish_baseline(database, plex, sonarr, radarr, letterboxd_resolver, forc
         except LetterboxdApiError as e:
             console.print(f"  [yellow]Warning:[/yellow] Could not fetch Letterboxd items: {e}")
 
-    console.print(f"\n[green]✓[/green] Baseline established")
-    console.print("[dim]Future syncs will only process new additions[/dim]\n")
+    console.print(
+        "\n[green]✓[/green] Baseline established\n"
+        "[dim]Future syncs will only process new additions[/dim]\n"
+    )
 
     return summary
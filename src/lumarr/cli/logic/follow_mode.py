@@ -1,19 +1,30 @@
 """Follow mode logic for continuous monitoring."""
 
-import builtins
 import logging
 import signal
 import sys
+import threading
 import time
-from datetime import datetime
-
-from ...api.letterboxd import LetterboxdApi, LetterboxdApiError
-from ...models import MediaType, RequestStatus
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from ...api.letterboxd import LetterboxdApiError
+from ...models import (
+    LetterboxdSyncResult,
+    LetterboxdSyncSummary,
+    MediaType,
+    RequestStatus,
+    dedup_by_rating_key,
+)
 from ..display.console import console
 from .sync_manager import SyncManager
 
 logger = logging.getLogger(__name__)
 
+# Snapshot once; redraws are pointless (and bloat captured logs with ANSI
+# escapes) when stdout is piped to a file or journal
+_IS_TTY = sys.stdout.isatty()
+
 
 def _format_error_message(error: Exception) -> str:
     """Format an error message for user display, hiding technical details.
@@ -101,22 +112,23 @@ def run_follow_mode(
         force_refresh=force_refresh,
     )
 
-    # Display follow mode info
+    # Display follow mode info; one print so the block costs a single
+    # markup parse and flush
     if has_letterboxd:
-        console.print(
+        enabled_line = (
             f"[yellow]Follow mode enabled - checking Plex every {plex_interval}s, "
             f"Letterboxd every {lbox_interval}s[/yellow]"
         )
     else:
-        console.print(f"[yellow]Follow mode enabled - checking Plex every {plex_interval}s[/yellow]")
-    console.print("[yellow]Press Ctrl+C to stop[/yellow]\n")
+        enabled_line = f"[yellow]Follow mode enabled - checking Plex every {plex_interval}s[/yellow]"
+    console.print(f"{enabled_line}\n[yellow]Press Ctrl+C to stop[/yellow]\n")
 
-    # Signal handler for graceful shutdown
-    shutdown_requested = False
+    # Signal handler for graceful shutdown; the event also unblocks the
+    # monitoring loop's wait so Ctrl+C takes effect immediately
+    shutdown_event = threading.Event()
 
     def signal_handler(_sig, _frame):
-        nonlocal shutdown_requested
-        shutdown_requested = True
+        shutdown_event.set()
         sys.stdout.write("\r\033[K")
         sys.stdout.flush()
         console.print("[yellow]Shutdown requested, stopping...[/yellow]")
@@ -125,17 +137,15 @@ def run_follow_mode(
     signal.signal(signal.SIGTERM, signal_handler)
 
     # Run initial full sync
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    console.print(f"[bold cyan]{'='*80}[/bold cyan]")
-    console.print(f"[bold]Initial Sync - {timestamp}[/bold]")
-    console.print(f"[bold cyan]{'='*80}[/bold cyan]\n")
+    # time.strftime skips the datetime object construction entirely
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+    rule = f"[bold cyan]{'='*80}[/bold cyan]"
+    console.print(f"{rule}\n[bold]Initial Sync - {timestamp}[/bold]\n{rule}\n")
 
     try:
         _run_full_sync(
             sync_manager,
             letterboxd_resolver,
-            rss_names,
-            watchlist_names,
             radarr,
             config,
             show_full_output=True,
@@ -146,13 +156,33 @@ def run_follow_mode(
 
     console.print(f"\n[dim]Monitoring for new items... (Ctrl+C to stop)[/dim]\n")
 
-    # Track last sync times
-    last_plex_sync = time.time()
-    last_lbox_sync = time.time()
-
-    # Monitoring loop with separate intervals
-    while not shutdown_requested:
-        current_time = time.time()
+    # Track last sync times on the monotonic clock: interval math must not
+    # stall or flood when NTP or DST shifts the wall clock
+    last_plex_sync = time.monotonic()
+    last_lbox_sync = time.monotonic()
+
+    # Update the countdown status line from a 1 Hz helper thread, but only
+    # when stdout is a terminal; when piped there is nobody watching it
+    if _IS_TTY:
+
+        def status_updater():
+            while not shutdown_event.wait(1):
+                now = time.monotonic()
+                next_plex = max(0, int(plex_interval - (now - last_plex_sync)))
+                if has_letterboxd:
+                    next_lbox = max(0, int(lbox_interval - (now - last_lbox_sync)))
+                    _update_status_line(
+                        f"Monitoring... (Plex in {next_plex}s, Letterboxd in {next_lbox}s)"
+                    )
+                else:
+                    _update_status_line(f"Monitoring... (Plex in {next_plex}s)")
+
+        threading.Thread(target=status_updater, daemon=True).start()
+
+    # Monitoring loop: sleep until the next sync is due instead of waking
+    # every half second just to check the timers
+    while not shutdown_event.is_set():
+        current_time = time.monotonic()
 
         # Check if Plex needs syncing
         if current_time - last_plex_sync >= plex_interval:
@@ -162,7 +192,7 @@ def run_follow_mode(
 
                 # Show added items with timestamp
                 if plex_results.movies_added > 0 or plex_results.shows_added > 0:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    timestamp = time.strftime("%H:%M:%S")
                     sys.stdout.write("\r\033[K")
                     sys.stdout.flush()
                     for result in plex_results.results:
@@ -180,8 +210,6 @@ def run_follow_mode(
             try:
                 lbox_results = _sync_letterboxd_items(
                     letterboxd_resolver,
-                    rss_names,
-                    watchlist_names,
                     radarr,
                     database,
                     sync_manager,
@@ -190,31 +218,25 @@ def run_follow_mode(
                 last_lbox_sync = current_time
 
                 # Show added items with timestamp
-                if lbox_results and lbox_results["added"] > 0:
-                    timestamp = datetime.now().strftime("%H:%M:%S")
+                if lbox_results and lbox_results.added > 0:
+                    timestamp = time.strftime("%H:%M:%S")
                     sys.stdout.write("\r\033[K")
                     sys.stdout.flush()
-                    for result in lbox_results["results"]:
-                        if result["status"] == RequestStatus.SUCCESS:
+                    for result in lbox_results.results:
+                        if result.status == RequestStatus.SUCCESS:
                             console.print(
-                                f"[{timestamp}] [green]✓[/green] Added: {result['item'].title} "
+                                f"[{timestamp}] [green]✓[/green] Added: {result.item.title} "
                                 f"(Letterboxd) → radarr"
                             )
             except Exception as e:
                 console.print(f"\r\033[K[red]Error checking Letterboxd:[/red] {_format_error_message(e)}")
                 logger.debug("Error in Letterboxd sync", exc_info=True)
 
-        # Update status line
-        if not shutdown_requested:
-            next_plex = max(0, int(plex_interval - (current_time - last_plex_sync)))
-            if has_letterboxd:
-                next_lbox = max(0, int(lbox_interval - (current_time - last_lbox_sync)))
-                _update_status_line(f"Monitoring... (Plex in {next_plex}s, Letterboxd in {next_lbox}s)")
-            else:
-                _update_status_line(f"Monitoring... (Plex in {next_plex}s)")
-
-        # Sleep for responsiveness to Ctrl+C
-        time.sleep(0.5)
+        # Block until the earliest deadline; the shutdown event wakes us early
+        next_deadline = last_plex_sync + plex_interval
+        if has_letterboxd:
+            next_deadline = min(next_deadline, last_lbox_sync + lbox_interval)
+        shutdown_event.wait(timeout=max(0.0, next_deadline - time.monotonic()))
 
     # Clear status line and show stopped message
     sys.stdout.write("\r\033[K")
@@ -223,21 +245,33 @@ def run_follow_mode(
 
 
 def _update_status_line(message):
-    """Update status line in place using ANSI codes."""
+    """Update status line in place using ANSI codes.
+
+    No-op when stdout is not a terminal, and skips the write entirely
+    when the text has not changed since the last redraw.
+    """
+    if not _IS_TTY or message == _update_status_line.last:
+        return
+    _update_status_line.last = message
     sys.stdout.write(f"\r\033[K{message}")
     sys.stdout.flush()
 
 
+_update_status_line.last = ""
+
+
 def _sync_letterboxd_items(
     letterboxd_resolver,
-    rss_names,
-    watchlist_names,
     radarr,
     database,
     sync_manager,
     config,
 ):
     """Sync Letterboxd movies to Radarr."""
+    # Memoized on the resolver, so each tick gets them for free
+    rss_names = letterboxd_resolver.resolve_rss_usernames()
+    watchlist_names = letterboxd_resolver.resolve_watchlist_usernames()
+
     if not rss_names and not watchlist_names:
         return None
 
@@ -245,58 +279,69 @@ def _sync_letterboxd_items(
         return None
 
     try:
-        letterboxd = LetterboxdApi(
-            usernames=rss_names,
-            watchlist_usernames=watchlist_names,
-        )
+        # Cached on the manager; only rebuilt if the usernames change
+        letterboxd = sync_manager._get_letterboxd(rss_names, watchlist_names)
+
+        min_rating = config.get("letterboxd.min_rating", 0)
 
-        items = []
+        sources = []
         if rss_names:
-            items.extend(letterboxd.get_watched_movies(rss_names))
-        if watchlist_names:
-            items.extend(letterboxd.get_watchlist_movies(watchlist_names))
+            # min_rating is applied at parse time inside the feed fetch
+            sources.append(
+                letterboxd.get_watched_movies(rss_names, min_rating=min_rating or None)
+            )
+        if watchlist_names and not min_rating:
+            # Scraped watchlist entries carry no rating, so a min_rating
+            # threshold would drop them all - skip the scrape entirely
+            sources.append(letterboxd.get_watchlist_movies(watchlist_names))
+
+        # Deduplicate in the same pass; one materialization at the end
+        items = list(dedup_by_rating_key(chain.from_iterable(sources)))
 
         if not items:
             return None
 
-        # Apply min_rating filter
-        min_rating = config.get("letterboxd.min_rating", 0)
-        if min_rating and min_rating > 0:
-            items = [item for item in items if item.rating is not None and item.rating >= min_rating]
-
-        # Deduplicate items
-        unique_items = {}
-        for item in items:
-            unique_items[item.rating_key] = item
-        items = builtins.list(unique_items.values())
+        # One bulk query answers is_synced for the whole batch
+        synced = database.get_synced_set([i.rating_key for i in items], "radarr")
 
-        if not items:
-            return None
+        # Resolve cached and missing TMDB IDs in one pre-pass: the prefetch
+        # bulk-loads the metadata table (assigning hits, honoring fresh
+        # failures) and fetches only the unknown film pages in parallel, so
+        # the loop below never blocks on a per-item lookup; only unsynced
+        # items are worth resolving
+        sync_manager._prefetch_letterboxd_tmdb(
+            [i for i in items if i.rating_key not in synced]
+        )
 
         # Sync items
-        lbox_summary = {"total": len(items), "added": 0, "skipped": 0, "failed": 0, "results": []}
+        lbox_summary = LetterboxdSyncSummary(total=len(items))
 
         for item in items:
             # Check if already synced
-            if database.is_synced(item.rating_key, "radarr"):
-                lbox_summary["skipped"] += 1
-                lbox_summary["results"].append(
-                    {"item": item, "status": RequestStatus.SKIPPED, "message": "Already synced"}
+            if item.rating_key in synced:
+                lbox_summary.skipped += 1
+                lbox_summary.results.append(
+                    LetterboxdSyncResult(item, RequestStatus.SKIPPED, "Already synced")
                 )
                 continue
 
             # Sync to Radarr
             result = sync_manager._sync_movie(item)
-            lbox_summary["results"].append(
-                {"item": item, "status": result.status, "message": result.message}
+            lbox_summary.results.append(
+                LetterboxdSyncResult(item, result.status, result.message)
             )
 
             if result.status == RequestStatus.SUCCESS:
-                lbox_summary["added"] += 1
+                lbox_summary.added += 1
             elif result.status == RequestStatus.SKIPPED:
-                lbox_summary["skipped"] += 1
+                lbox_summary.skipped += 1
             elif result.status == RequestStatus.FAILED:
-                lbox_summary["failed"] += 1
+                lbox_summary.failed += 1
+
+        # One batched write and one batched search command for everything
+        # processed this pass
+        sync_manager.flush_sync_records()
+        sync_manager.flush_searches()
 
         return lbox_summary
 
@@ -309,26 +354,27 @@ def _sync_letterboxd_items(
 def _run_full_sync(
     sync_manager,
     letterboxd_resolver,
-    rss_names,
-    watchlist_names,
     radarr,
     config,
     show_full_output=True,
 ):
     """Run a full sync of both Plex and Letterboxd."""
-    # Sync Plex
-    summary = sync_manager.sync()
-
-    # Sync Letterboxd
-    lbox_summary = _sync_letterboxd_items(
-        letterboxd_resolver,
-        rss_names,
-        watchlist_names,
-        radarr,
-        sync_manager.database,
-        sync_manager,
-        config,
-    )
+    # The two branches hit different hosts (Plex vs letterboxd.com) and
+    # share no state until the summary, so run them on separate threads;
+    # SyncManager serializes its database writes internally
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        plex_future = pool.submit(sync_manager.sync)
+        lbox_future = pool.submit(
+            _sync_letterboxd_items,
+            letterboxd_resolver,
+            radarr,
+            sync_manager.database,
+            sync_manager,
+            config,
+        )
+
+        summary = plex_future.result()
+        lbox_summary = lbox_future.result()
 
     # Display results if requested
     if show_full_output:
@@ -1,6 +1,9 @@
 """Sync orchestration for Plex watchlist to Sonarr/Radarr."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional
 
 from ...api.plex import PlexApi, PlexApiError
@@ -8,10 +11,27 @@ from ...api.radarr import RadarrApi, RadarrApiError
 from ...api.sonarr import SonarrApi, SonarrApiError
 from ...api.tmdb import TmdbApi
 from ...db import Database
-from ...models import MediaType, RequestStatus, SyncResult, SyncSummary, WatchlistItem
+from ...models import (
+    MediaType,
+    ProviderId,
+    RequestStatus,
+    SyncResult,
+    SyncSummary,
+    WatchlistItem,
+)
 
 logger = logging.getLogger(__name__)
 
+# How long a cached provider ID mapping stays fresh. Mappings between
+# IMDB/TVDB and TMDB IDs essentially never change, so stale entries are
+# still served while a background refresh runs
+ID_MAPPING_TTL = timedelta(days=7)
+
+# How long a cached "no TMDB ID found" Letterboxd result is honored
+# before the film page is scraped again. Pages for films missing a TMDB
+# link rarely gain one, so a month between retries is plenty
+LETTERBOXD_NEGATIVE_TTL = timedelta(days=30)
+
 
 class SyncManager:
     """Manages synchronization between Plex watchlist and Sonarr/Radarr."""
@@ -44,6 +64,310 @@ class SyncManager:
         self.tmdb = tmdb
         self.dry_run = dry_run
         self.force_refresh = force_refresh
+        # Evaluated once: whether TMDB enhancement is available cannot
+        # change during a run, so the per-item paths branch on a bool
+        self._tmdb_on = bool(tmdb and tmdb.is_configured())
+        # Serializes database writes when the Plex and Letterboxd branches
+        # run on separate threads during the initial full sync
+        self._db_lock = threading.Lock()
+        # IDs of newly added items whose search was deferred; flushed as one
+        # batched command per service instead of one search task per item
+        self._search_lock = threading.Lock()
+        self._pending_movie_searches = []
+        self._pending_series_searches = []
+        # Cached Letterboxd client, rebuilt only when the username sets
+        # change; reused across follow-mode ticks so its session and
+        # cache wiring persist
+        self._letterboxd = None
+        # Per-service synced rating keys, bulk-loaded at the start of each
+        # sync() so the loop tests membership in memory instead of issuing
+        # one SELECT per item
+        self._synced_cache = {}
+        # Sync records buffered during a pass and flushed as one
+        # transaction instead of one commit (fsync) per item
+        self._pending_sync_records = []
+        # Media-type dispatch as one dict lookup instead of an enum
+        # comparison chain in the per-item path
+        self._dispatch = {
+            MediaType.MOVIE: self._sync_movie,
+            MediaType.TV_SHOW: self._sync_tv_show,
+        }
+
+    def _record_sync(
+        self,
+        rating_key,
+        title,
+        media_type,
+        target_service,
+        status,
+        tmdb_id=None,
+        tvdb_id=None,
+        imdb_id=None,
+        error_message=None,
+    ):
+        """Buffer a sync record for the next flush_sync_records call."""
+        with self._db_lock:
+            self._pending_sync_records.append((
+                rating_key,
+                title,
+                media_type.value,
+                tmdb_id,
+                tvdb_id,
+                imdb_id,
+                target_service,
+                status.value,
+                error_message,
+            ))
+        if status == RequestStatus.SUCCESS:
+            cached = self._synced_cache.get(target_service)
+            if cached is not None:
+                cached.add(rating_key)
+
+    def flush_sync_records(self):
+        """Write all buffered sync records in one transaction."""
+        with self._db_lock:
+            rows = self._pending_sync_records
+            self._pending_sync_records = []
+            self.database.record_sync_many(rows)
+
+    def _is_synced(self, rating_key: str, target_service: str) -> bool:
+        """Check sync status against the bulk-loaded cache when available.
+
+        Falls back to a direct query for callers outside sync(), such as
+        the Letterboxd tick in follow mode, where the cache may not have
+        been loaded.
+
+        Args:
+            rating_key: Plex rating key
+            target_service: Target service (sonarr/radarr)
+
+        Returns:
+            True if item was previously synced successfully
+        """
+        cached = self._synced_cache.get(target_service)
+        if cached is not None:
+            return rating_key in cached
+        return self.database.is_synced(rating_key, target_service)
+
+    def _get_letterboxd(self, rss_names=(), watchlist_names=()):
+        """Return a cached LetterboxdApi for the given username sets.
+
+        Constructing the client per tick rebuilt its HTTP session wiring
+        every lbox_interval; the instance is cached and only replaced when
+        the resolved usernames actually change.
+
+        Args:
+            rss_names: Usernames whose RSS feeds are fetched
+            watchlist_names: Usernames whose watchlists are scraped
+
+        Returns:
+            LetterboxdApi configured for these usernames
+        """
+        cached = self._letterboxd
+        if (
+            cached is None
+            or cached.usernames != list(rss_names)
+            or cached.watchlist_usernames != list(watchlist_names)
+        ):
+            from ...api.letterboxd import LetterboxdApi
+
+            self._letterboxd = LetterboxdApi(
+                usernames=list(rss_names),
+                watchlist_usernames=list(watchlist_names),
+                database=self.database,
+                force_refresh=self.force_refresh,
+                session=self.plex.session,
+            )
+        return self._letterboxd
+
+    def _enhance_with_cache(self, provider_ids: ProviderId, media_type: str) -> ProviderId:
+        """Enhance provider IDs, serving resolved mappings from the DB.
+
+        IMDB/TVDB-to-TMDB mappings are effectively immutable, so once an
+        item has been resolved there is no reason to hit TMDB for it
+        again on the next run. Fresh cache entries are served directly;
+        stale ones are served immediately while a background thread
+        re-resolves them (stale-while-revalidate); misses fall through to
+        the live lookup and are stored on success. --force-refresh
+        bypasses the cache.
+
+        Args:
+            provider_ids: Existing provider IDs
+            media_type: Type of media ('movie' or 'show')
+
+        Returns:
+            Enhanced ProviderId object
+        """
+        if provider_ids.imdb_id:
+            source_type, source_id = "imdb", provider_ids.imdb_id
+        elif provider_ids.tvdb_id:
+            source_type, source_id = "tvdb", provider_ids.tvdb_id
+        else:
+            return self.tmdb.enhance_provider_ids(provider_ids, media_type)
+
+        if not self.force_refresh:
+            cached = self.database.get_id_mapping(source_type, source_id)
+            if cached:
+                if cached.get("tmdb_id") and not provider_ids.tmdb_id:
+                    provider_ids.tmdb_id = cached["tmdb_id"]
+                if cached.get("tvdb_id") and not provider_ids.tvdb_id:
+                    provider_ids.tvdb_id = cached["tvdb_id"]
+
+                fetched_at = datetime.fromisoformat(cached["fetched_at"])
+                if datetime.now() - fetched_at > ID_MAPPING_TTL:
+                    threading.Thread(
+                        target=self._refresh_id_mapping,
+                        args=(source_type, source_id, media_type),
+                        daemon=True,
+                    ).start()
+                return provider_ids
+
+        provider_ids = self.tmdb.enhance_provider_ids(provider_ids, media_type)
+        if provider_ids.tmdb_id:
+            with self._db_lock:
+                self.database.set_id_mapping(
+                    source_type,
+                    source_id,
+                    tmdb_id=provider_ids.tmdb_id,
+                    tvdb_id=provider_ids.tvdb_id,
+                    imdb_id=provider_ids.imdb_id,
+                )
+        return provider_ids
+
+    def _refresh_id_mapping(self, source_type: str, source_id: str, media_type: str):
+        """Re-resolve a stale ID mapping off the sync path."""
+        if source_type == "imdb":
+            ids = ProviderId(imdb_id=source_id)
+        else:
+            ids = ProviderId(tvdb_id=source_id)
+        enhanced = self.tmdb.enhance_provider_ids(ids, media_type)
+        if enhanced.tmdb_id:
+            with self._db_lock:
+                self.database.set_id_mapping(
+                    source_type,
+                    source_id,
+                    tmdb_id=enhanced.tmdb_id,
+                    tvdb_id=enhanced.tvdb_id,
+                    imdb_id=enhanced.imdb_id,
+                )
+
+    @staticmethod
+    def _letterboxd_negative_fresh(cached) -> bool:
+        """Check whether a cached no-TMDB-ID row is recent enough to honor.
+
+        Rows written before failures were timestamped have no fetched_at;
+        those get one more fetch, which stamps them.
+
+        Args:
+            cached: Metadata row from the letterboxd_metadata table
+
+        Returns:
+            True if the cached failure is within LETTERBOXD_NEGATIVE_TTL
+        """
+        fetched_at = cached.get("fetched_at")
+        if not fetched_at:
+            return False
+        return (
+            datetime.now() - datetime.fromisoformat(fetched_at)
+            <= LETTERBOXD_NEGATIVE_TTL
+        )
+
+    def _prefetch_letterboxd_tmdb(self, items):
+        """Resolve missing TMDB IDs for Letterboxd items before the loop.
+
+        Film-page fetches are the dominant latency of a Letterboxd pass;
+        doing them serially inside _sync_movie stacks their round trips.
+        This pre-pass fetches the missing pages on a small pool (the
+        per-page retry/delay mechanics still apply per request) and
+        stores the results with one batched write, so the sync loop only
+        sees dict hits.
+
+        Args:
+            items: Letterboxd watchlist items, possibly missing TMDB IDs
+        """
+        candidates = [
+            item
+            for item in items
+            if item.letterboxd_id
+            and item.letterboxd_slug
+            and not item.provider_ids.tmdb_id
+        ]
+        if not candidates:
+            return
+
+        # One bulk query resolves what a previous pass already learned:
+        # cached IDs are assigned, fresh failures are skipped, and only
+        # genuinely unknown (or stale-failed) films hit the network
+        cached_rows = self.database.get_letterboxd_metadata_many(
+            [item.letterboxd_id for item in candidates]
+        )
+        pending = []
+        for item in candidates:
+            cached = cached_rows.get(item.letterboxd_id)
+            if cached is not None:
+                if cached.get("tmdb_id"):
+                    item.provider_ids.tmdb_id = cached["tmdb_id"]
+                    continue
+                if not self.force_refresh and self._letterboxd_negative_fresh(cached):
+                    continue
+            pending.append(item)
+        if not pending:
+            return
+
+        letterboxd = self._letterboxd or self._get_letterboxd()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            tmdb_ids = list(
+                pool.map(
+                    lambda item: letterboxd.fetch_tmdb_id_from_page(item.letterboxd_slug),
+                    pending,
+                )
+            )
+
+        rows = []
+        for item, tmdb_id in zip(pending, tmdb_ids):
+            if tmdb_id:
+                item.provider_ids.tmdb_id = tmdb_id
+                logger.info("  ✓ Resolved TMDB ID %s for %s", tmdb_id, item.title)
+            # Store failures too so the next pass doesn't refetch the page
+            rows.append((
+                item.letterboxd_id,
+                item.letterboxd_slug,
+                tmdb_id,
+                item.title,
+                item.year,
+            ))
+
+        with self._db_lock:
+            self.database.set_letterboxd_metadata_many(rows)
+
+    def flush_searches(self):
+        """Queue the deferred search commands once adds are done.
+
+        Radarr takes all movie IDs in a single MoviesSearch command;
+        Sonarr has no multi-series form, so it gets one command per
+        series. Failures here are logged rather than raised; the items were added
+        successfully and will be picked up by the Arr's own scheduled
+        missing search even if the immediate command fails.
+        """
+        with self._search_lock:
+            movie_ids = self._pending_movie_searches
+            series_ids = self._pending_series_searches
+            self._pending_movie_searches = []
+            self._pending_series_searches = []
+
+        if movie_ids and self.radarr:
+            try:
+                self.radarr.search_movies(movie_ids)
+                logger.debug(f"Queued batched search for {len(movie_ids)} movies")
+            except RadarrApiError as e:
+                logger.warning(f"Batched movie search failed: {e}")
+
+        if series_ids and self.sonarr:
+            try:
+                self.sonarr.search_missing_episodes(series_ids)
+                logger.debug(f"Queued missing-episode search for {len(series_ids)} series")
+            except SonarrApiError as e:
+                logger.warning(f"Deferred episode search failed: {e}")
 
     def sync(self) -> SyncSummary:
         """Sync Plex watchlist to Sonarr and Radarr.
@@ -55,28 +379,43 @@ class SyncManager:
 
         logger.debug("Starting Plex watchlist sync")
 
-        try:
-            watchlist = self.plex.get_watchlist(force_refresh=self.force_refresh)
-            summary.total = len(watchlist)
-            logger.debug(f"Found {summary.total} items in Plex watchlist")
+        # One bulk query per configured service replaces the per-item
+        # is_synced round trips inside the loop
+        if self.radarr:
+            self._synced_cache["radarr"] = self.database.get_synced_keys("radarr")
+        if self.sonarr:
+            self._synced_cache["sonarr"] = self.database.get_synced_keys("sonarr")
 
-            for item in watchlist:
-                result = self._sync_item(item)
+        try:
+            # Stream the watchlist so syncing starts with the first page
+            # instead of waiting for the full list to download. Items are
+            # fanned out to a small worker pool: each one is an independent
+            # chain of HTTP round trips (TMDB lookup, Arr add), so serial
+            # execution pays the sum of all RTTs. Database writes stay
+            # serialized behind _db_lock and the search queue behind
+            # _search_lock, so the workers only overlap network waits.
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = []
+                for item in self.plex.iter_watchlist(force_refresh=self.force_refresh):
+                    summary.total += 1
+                    futures.append((item, pool.submit(self._sync_item, item)))
+
+            # Tally in submission order so results stay deterministic
+            for item, future in futures:
+                result = future.result()
                 summary.results.append(result)
+                summary.tally(result.status, item.media_type)
 
-                if result.status == RequestStatus.SUCCESS:
-                    if item.media_type == MediaType.MOVIE:
-                        summary.movies_added += 1
-                    elif item.media_type == MediaType.TV_SHOW:
-                        summary.shows_added += 1
-                elif result.status == RequestStatus.SKIPPED:
-                    summary.skipped += 1
-                elif result.status == RequestStatus.FAILED:
-                    summary.failed += 1
+            logger.debug(f"Found {summary.total} items in Plex watchlist")
 
         except PlexApiError as e:
             logger.error(f"Failed to fetch Plex watchlist: {e}")
             raise
+        finally:
+            # Persist whatever was recorded even if the fetch died mid-pass
+            self.flush_sync_records()
+
+        self.flush_searches()
 
         # Only log at INFO level if items were added or failed
         items_changed = summary.movies_added + summary.shows_added + summary.failed
@@ -98,19 +437,17 @@ class SyncManager:
         Returns:
             SyncResult with outcome
         """
-        logger.debug(f"Processing: {item.title} ({item.media_type.value})")
-
-        if item.media_type == MediaType.MOVIE:
-            return self._sync_movie(item)
-        elif item.media_type == MediaType.TV_SHOW:
-            return self._sync_tv_show(item)
-        else:
-            return SyncResult(
-                item=item,
-                status=RequestStatus.FAILED,
-                message=f"Unsupported media type: {item.media_type}",
-                target_service="none",
-            )
+        logger.debug("Processing: %s (%s)", item.title, item.media_type.value)
+        return self._dispatch.get(item.media_type, self._unsupported)(item)
+
+    def _unsupported(self, item: WatchlistItem) -> SyncResult:
+        """Fail an item whose media type has no sync handler."""
+        return SyncResult(
+            item=item,
+            status=RequestStatus.FAILED,
+            message=f"Unsupported media type: {item.media_type}",
+            target_service="none",
+        )
 
     def _sync_movie(self, item: WatchlistItem) -> SyncResult:
         """Sync a movie to Radarr.
@@ -129,8 +466,8 @@ class SyncManager:
                 target_service="radarr",
             )
 
-        if self.database.is_synced(item.rating_key, "radarr"):
-            logger.debug(f"  Skipping (already synced): {item.title}")
+        if self._is_synced(item.rating_key, "radarr"):
+            logger.debug("  Skipping (already synced): %s", item.title)
             return SyncResult(
                 item=item,
                 status=RequestStatus.SKIPPED,
@@ -146,56 +483,78 @@ class SyncManager:
             if cached and cached.get("tmdb_id"):
                 # Use cached TMDB ID
                 item.provider_ids.tmdb_id = cached["tmdb_id"]
-                logger.debug(f"  Using cached TMDB ID {item.provider_ids.tmdb_id} for Letterboxd item {item.letterboxd_slug}")
+                logger.debug(
+                    "  Using cached TMDB ID %s for Letterboxd item %s",
+                    item.provider_ids.tmdb_id,
+                    item.letterboxd_slug,
+                )
+            elif (
+                cached is not None
+                and not self.force_refresh
+                and self._letterboxd_negative_fresh(cached)
+            ):
+                # A previous fetch already found no TMDB ID on the film
+                # page; honor that instead of re-scraping every run
+                logger.debug(
+                    "  Skipping TMDB fetch for %s: no ID found on %s",
+                    item.letterboxd_slug,
+                    cached["fetched_at"],
+                )
             else:
                 # Need to fetch from page
-                logger.info(f"  Fetching TMDB ID for Letterboxd item: {item.title} ({item.letterboxd_slug})")
-                from .api.letterboxd import LetterboxdApi
-
-                letterboxd = LetterboxdApi()
+                logger.info(
+                    "  Fetching TMDB ID for Letterboxd item: %s (%s)",
+                    item.title,
+                    item.letterboxd_slug,
+                )
+                # Any cached client will do - film-page fetches don't
+                # depend on the configured usernames
+                letterboxd = self._letterboxd or self._get_letterboxd()
                 tmdb_id = letterboxd.fetch_tmdb_id_from_page(item.letterboxd_slug)
 
                 if tmdb_id:
                     item.provider_ids.tmdb_id = tmdb_id
                     # Store in database for future use
-                    self.database.set_letterboxd_metadata(
-                        letterboxd_id=item.letterboxd_id,
-                        slug=item.letterboxd_slug,
-                        title=item.title,
-                        year=item.year,
-                        tmdb_id=tmdb_id,
-                    )
-                    logger.info(f"  ✓ Resolved TMDB ID {tmdb_id} for {item.title}")
+                    with self._db_lock:
+                        self.database.set_letterboxd_metadata(
+                            letterboxd_id=item.letterboxd_id,
+                            slug=item.letterboxd_slug,
+                            title=item.title,
+                            year=item.year,
+                            tmdb_id=tmdb_id,
+                        )
+                    logger.info("  ✓ Resolved TMDB ID %s for %s", tmdb_id, item.title)
                 else:
                     # Still store the metadata without TMDB ID so we don't keep retrying
-                    self.database.set_letterboxd_metadata(
-                        letterboxd_id=item.letterboxd_id,
-                        slug=item.letterboxd_slug,
-                        title=item.title,
-                        year=item.year,
-                        tmdb_id=None,
-                    )
+                    with self._db_lock:
+                        self.database.set_letterboxd_metadata(
+                            letterboxd_id=item.letterboxd_id,
+                            slug=item.letterboxd_slug,
+                            title=item.title,
+                            year=item.year,
+                            tmdb_id=None,
+                        )
 
         # Log available IDs before enhancement
         logger.debug(
-            f"  IDs before enhancement - TMDB: {item.provider_ids.tmdb_id}, "
-            f"IMDB: {item.provider_ids.imdb_id}, TVDB: {item.provider_ids.tvdb_id}"
+            "  IDs before enhancement - TMDB: %s, IMDB: %s, TVDB: %s",
+            item.provider_ids.tmdb_id,
+            item.provider_ids.imdb_id,
+            item.provider_ids.tvdb_id,
         )
 
         # Try to enhance provider IDs using TMDB API
-        if self.tmdb and self.tmdb.is_configured():
+        if self._tmdb_on:
             original_tmdb_id = item.provider_ids.tmdb_id
-            item.provider_ids = self.tmdb.enhance_provider_ids(
-                item.provider_ids, "movie"
-            )
+            item.provider_ids = self._enhance_with_cache(item.provider_ids, "movie")
             if item.provider_ids.tmdb_id and not original_tmdb_id:
-                logger.info(f"  ✓ Resolved TMDB ID via IMDB lookup: {item.provider_ids.tmdb_id}")
+                logger.info("  ✓ Resolved TMDB ID via IMDB lookup: %s", item.provider_ids.tmdb_id)
 
         # Check if we have TMDB ID after enhancement
         if not item.provider_ids.tmdb_id:
             # Build helpful error message based on what IDs we have
             if item.provider_ids.imdb_id:
-                if not self.tmdb or not self.tmdb.is_configured():
+                if not self._tmdb_on:
                     message = (
                         f"No TMDB ID found - only have IMDB ID ({item.provider_ids.imdb_id}). "
                         "Configure TMDB API key to enable IMDB→TMDB conversion."
@@ -208,8 +567,8 @@ class SyncManager:
             else:
                 message = "No TMDB ID or IMDB ID found - required for Radarr"
 
-            logger.warning(f"  {message}: {item.title}")
-            self.database.record_sync(
+            logger.warning("  %s: %s", message, item.title)
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
@@ -226,7 +585,7 @@ class SyncManager:
             )
 
         if self.dry_run:
-            logger.info(f"  [DRY RUN] Would add to Radarr: {item.title}")
+            logger.info("  [DRY RUN] Would add to Radarr: %s", item.title)
             return SyncResult(
                 item=item,
                 status=RequestStatus.SUCCESS,
@@ -239,11 +598,17 @@ class SyncManager:
                 provider_ids=item.provider_ids,
                 title=item.title,
                 year=item.year,
+                defer_search=True,
             )
 
-            logger.info(f"  {result['message']}")
+            logger.info("  %s", result["message"])
 
-            self.database.record_sync(
+            movie_id = (result.get("movie") or {}).get("id")
+            if result.get("added") and self.radarr.search_on_add and movie_id:
+                with self._search_lock:
+                    self._pending_movie_searches.append(movie_id)
+
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
@@ -261,8 +626,8 @@ class SyncManager:
             )
 
         except RadarrApiError as e:
-            logger.error(f"  Failed to add to Radarr: {e}")
-            self.database.record_sync(
+            logger.error("  Failed to add to Radarr: %s", e)
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
@@ -295,8 +660,8 @@ class SyncManager:
                 target_service="sonarr",
             )
 
-        if self.database.is_synced(item.rating_key, "sonarr"):
-            logger.debug(f"  Skipping (already synced): {item.title}")
+        if self._is_synced(item.rating_key, "sonarr"):
+            logger.debug("  Skipping (already synced): %s", item.title)
             return SyncResult(
                 item=item,
                 status=RequestStatus.SKIPPED,
@@ -306,24 +671,24 @@ class SyncManager:
 
         # Log available IDs before enhancement
         logger.debug(
-            f"  IDs before enhancement - TVDB: {item.provider_ids.tvdb_id}, "
-            f"TMDB: {item.provider_ids.tmdb_id}, IMDB: {item.provider_ids.imdb_id}"
+            "  IDs before enhancement - TVDB: %s, TMDB: %s, IMDB: %s",
+            item.provider_ids.tvdb_id,
+            item.provider_ids.tmdb_id,
+            item.provider_ids.imdb_id,
         )
 
         # Try to enhance provider IDs using TMDB API
-        if self.tmdb and self.tmdb.is_configured():
+        if self._tmdb_on:
             original_tvdb_id = item.provider_ids.tvdb_id
-            item.provider_ids = self.tmdb.enhance_provider_ids(
-                item.provider_ids, "show"
-            )
+            item.provider_ids = self._enhance_with_cache(item.provider_ids, "show")
             if item.provider_ids.tvdb_id and not original_tvdb_id:
-                logger.info(f"  ✓ Resolved TVDB ID via TMDB lookup: {item.provider_ids.tvdb_id}")
+                logger.info("  ✓ Resolved TVDB ID via TMDB lookup: %s", item.provider_ids.tvdb_id)
 
         # Check if we have TVDB ID after enhancement
         if not item.provider_ids.tvdb_id:
             # Build helpful error message based on what IDs we have
             if item.provider_ids.tmdb_id or item.provider_ids.imdb_id:
-                if not self.tmdb or not self.tmdb.is_configured():
+                if not self._tmdb_on:
                     available_ids = []
                     if item.provider_ids.tmdb_id:
                         available_ids.append(f"TMDB: {item.provider_ids.tmdb_id}")
@@ -341,8 +706,8 @@ class SyncManager:
             else:
                 message = "No TVDB ID found - required for Sonarr"
 
-            logger.warning(f"  {message}: {item.title}")
-            self.database.record_sync(
+            logger.warning("  %s: %s", message, item.title)
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
@@ -360,7 +725,7 @@ class SyncManager:
             )
 
         if self.dry_run:
-            logger.info(f"  [DRY RUN] Would add to Sonarr: {item.title}")
+            logger.info("  [DRY RUN] Would add to Sonarr: %s", item.title)
             return SyncResult(
                 item=item,
                 status=RequestStatus.SUCCESS,
@@ -372,11 +737,17 @@ class SyncManager:
             result = self.sonarr.add_series(
                 provider_ids=item.provider_ids,
                 title=item.title,
+                defer_search=True,
             )
 
-            logger.info(f"  {result['message']}")
+            logger.info("  %s", result["message"])
+
+            series_id = (result.get("series") or {}).get("id")
+            if result.get("added") and series_id:
+                with self._search_lock:
+                    self._pending_series_searches.append(series_id)
 
-            self.database.record_sync(
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
@@ -395,8 +766,8 @@ class SyncManager:
             )
 
         except SonarrApiError as e:
-            logger.error(f"  Failed to add to Sonarr: {e}")
-            self.database.record_sync(
+            logger.error("  Failed to add to Sonarr: %s", e)
+            self._record_sync(
                 rating_key=item.rating_key,
                 title=item.title,
                 media_type=item.media_type,
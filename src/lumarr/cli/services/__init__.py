@@ -1,15 +1,26 @@
-"""Service layer for API wrappers and resource management."""
-
-from .database import DatabaseService
-from .plex import PlexService
-from .sonarr import SonarrService
-from .radarr import RadarrService
-from .letterboxd import LetterboxdResolver
-
-__all__ = [
-    "DatabaseService",
-    "PlexService",
-    "SonarrService",
-    "RadarrService",
-    "LetterboxdResolver",
-]
+"""Service layer for API wrappers and resource management.
+
+Submodules are imported lazily (PEP 562): each drags in its api client
+and with it requests/urllib3, a cost `lumarr --help` should not pay.
+"""
+
+import importlib
+
+_LAZY = {
+    "DatabaseService": ".database",
+    "PlexService": ".plex",
+    "SonarrService": ".sonarr",
+    "RadarrService": ".radarr",
+    "LetterboxdResolver": ".letterboxd",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
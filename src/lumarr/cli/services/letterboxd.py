@@ -1,7 +1,5 @@
 """Letterboxd service and resolution helpers."""
 
-import builtins
-
 from ..display.console import console
 
 
@@ -16,17 +14,34 @@ class LetterboxdResolver:
             config: Config object
         """
         self.config = config
+        # Memoized results keyed by the override tuple; resolution re-reads
+        # config and may print a deprecation warning, so do it once per
+        # resolver instance instead of on every call site
+        self._cache = {}
+
+    def clear_cache(self):
+        """Drop memoized results, e.g. after a config reload."""
+        self._cache.clear()
 
     def resolve_rss_usernames(self, rss_overrides=()):
         """
         Determine Letterboxd RSS usernames from CLI overrides or config.
 
+        Results are memoized per override tuple; call clear_cache() after
+        a config reload.
+
         Args:
             rss_overrides: Tuple of usernames provided via CLI
 
         Returns:
             List of usernames to fetch RSS feeds for
         """
+        key = ("rss", tuple(rss_overrides))
+        if key not in self._cache:
+            self._cache[key] = self._resolve_rss_usernames(rss_overrides)
+        return self._cache[key]
+
+    def _resolve_rss_usernames(self, rss_overrides):
         # CLI overrides take precedence
         usernames = [*rss_overrides]
         if usernames:
@@ -37,10 +52,10 @@ class LetterboxdResolver:
         if config_rss:
             if isinstance(config_rss, str):
                 return [config_rss]
-            if isinstance(config_rss, builtins.list):
+            if isinstance(config_rss, list):
                 return config_rss
             try:
-                return builtins.list(config_rss)
+                return list(config_rss)
             except TypeError:
                 pass
 
@@ -53,10 +68,10 @@ class LetterboxdResolver:
             )
             if isinstance(legacy_usernames, str):
                 return [legacy_usernames]
-            if isinstance(legacy_usernames, builtins.list):
+            if isinstance(legacy_usernames, list):
                 return legacy_usernames
             try:
-                return builtins.list(legacy_usernames)
+                return list(legacy_usernames)
             except TypeError:
                 pass
 
@@ -66,12 +81,21 @@ class LetterboxdResolver:
         """
         Determine Letterboxd watchlist usernames from CLI overrides or config.
 
+        Results are memoized per override tuple; call clear_cache() after
+        a config reload.
+
         Args:
             watchlist_overrides: Tuple of usernames provided via CLI
 
         Returns:
             List of usernames to fetch watchlists for
         """
+        key = ("watchlist", tuple(watchlist_overrides))
+        if key not in self._cache:
+            self._cache[key] = self._resolve_watchlist_usernames(watchlist_overrides)
+        return self._cache[key]
+
+    def _resolve_watchlist_usernames(self, watchlist_overrides):
         # CLI overrides take precedence
         usernames = [*watchlist_overrides]
         if usernames:
@@ -81,10 +105,10 @@ class LetterboxdResolver:
         config_watchlist = self.config.get("letterboxd.watchlist", [])
         if isinstance(config_watchlist, str):
             return [config_watchlist]
-        if isinstance(config_watchlist, builtins.list):
+        if isinstance(config_watchlist, list):
             return config_watchlist
         try:
-            return builtins.list(config_watchlist)
+            return list(config_watchlist)
         except TypeError:
             return []
 
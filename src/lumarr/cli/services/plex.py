@@ -2,6 +2,13 @@
 
 from ...api.plex import PlexApi
 
+# Process-level cache of PlexApi instances keyed by connection settings.
+# When the CLI is driven programmatically (multiple commands in one process),
+# this reuses the underlying session and caches instead of rebuilding the
+# client per command. The database reference is refreshed on every hit since
+# each command opens its own Database.
+_plex_api_cache = {}
+
 
 class PlexService:
     """
@@ -20,24 +27,41 @@ class PlexService:
         self._api = api
 
     @classmethod
-    def from_config(cls, config, database):
+    def from_config(cls, config, database, session=None):
         """
         Create PlexService from configuration.
 
         Args:
             config: Config object
             database: Database instance for caching
+            session: Optional shared requests.Session
 
         Returns:
             PlexService instance
         """
-        api = PlexApi(
-            auth_token=config.get("plex.token"),
-            client_identifier=config.get("plex.client_identifier", "lumarr"),
-            database=database,
-            cache_max_age_days=config.get("sync.cache_max_age_days", 7),
-            rss_id=config.get("plex.rss_id"),
-        )
+        auth_token = config.get("plex.token")
+        client_identifier = config.get("plex.client_identifier", "lumarr")
+        cache_max_age_days = config.get("sync.cache_max_age_days", 7)
+        rss_id = config.get("plex.rss_id")
+
+        cache_key = (auth_token, client_identifier, cache_max_age_days, rss_id)
+        api = _plex_api_cache.get(cache_key)
+
+        if api is None:
+            api = PlexApi(
+                auth_token=auth_token,
+                client_identifier=client_identifier,
+                database=database,
+                cache_max_age_days=cache_max_age_days,
+                rss_id=rss_id,
+                session=session,
+            )
+            _plex_api_cache[cache_key] = api
+        else:
+            # Rebind the per-command database; the session and client state
+            # are reused as-is
+            api.database = database
+
         return cls(api)
 
     def __enter__(self):
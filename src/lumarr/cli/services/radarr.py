@@ -21,12 +21,13 @@ class RadarrService:
         self._api = api
 
     @classmethod
-    def from_config(cls, config):
+    def from_config(cls, config, session=None):
         """
         Create RadarrService from configuration.
 
         Args:
             config: Config object
+            session: Optional shared requests.Session
 
         Returns:
             RadarrService instance
@@ -42,6 +43,7 @@ class RadarrService:
             root_folder=config.get("radarr.root_folder"),
             monitored=config.get("radarr.monitored", True),
             search_on_add=config.get("radarr.search_on_add", True),
+            session=session,
         )
         return cls(api)
 
@@ -21,12 +21,13 @@ class SonarrService:
         self._api = api
 
     @classmethod
-    def from_config(cls, config):
+    def from_config(cls, config, session=None):
         """
         Create SonarrService from configuration.
 
         Args:
             config: Config object
+            session: Optional shared requests.Session
 
         Returns:
             SonarrService instance
@@ -43,6 +44,7 @@ class SonarrService:
             series_type=config.get("sonarr.series_type", "standard"),
             season_folder=config.get("sonarr.season_folder", True),
             monitor_all=config.get("sonarr.monitor_all", False),
+            session=session,
         )
         return cls(api)
 
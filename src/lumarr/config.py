@@ -1,18 +1,54 @@
 """Configuration management."""
 
+import atexit
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+# libyaml's C loader parses 10-50x faster than the pure-Python one and
+# matters because the CLI is often invoked per-cron; fall back when
+# PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigError(Exception):
     """Configuration error."""
     pass
 
 
+def _flatten(data: dict, prefix: str = "") -> dict:
+    """Flatten a nested dict into dot-notation keys.
+
+    Every node gets an entry, so both leaf values ('plex.token') and
+    whole sections ('sonarr') resolve with a single lookup. None values
+    are skipped so they fall through to the caller's default, matching
+    the old walk behaviour.
+
+    Args:
+        data: Nested configuration dict
+        prefix: Dot-joined path of the enclosing keys
+
+    Returns:
+        Flat dict mapping dot-notation keys to values
+    """
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if value is None:
+            continue
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+    return flat
+
+
 class Config:
     """Configuration container."""
 
@@ -35,12 +71,16 @@ class Config:
 
         try:
             with open(self.config_path) as f:
-                self.data = yaml.safe_load(f)
+                self.data = yaml.load(f, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML in config file: {e}")
 
         self._validate()
 
+        # Precompute dot-notation lookups once; get() is called dozens of
+        # times per run and nobody mutates self.data after load
+        self._flat = _flatten(self.data or {})
+
     def _validate(self):
         """Validate required configuration."""
         if not self.data.get("plex", {}).get("token"):
@@ -76,19 +116,7 @@ class Config:
         Returns:
             Config value or default
         """
-        keys = key.split(".")
-        value = self.data
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-
-            if value is None:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
 
 def setup_logging(config: Config):
@@ -119,7 +147,17 @@ def setup_logging(config: Config):
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
         file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
+        # Buffer file writes so per-item debug logging doesn't pay one
+        # write syscall per record; warnings and errors flush the buffer
+        # immediately, and an atexit hook drains whatever is left. The
+        # console handler stays unbuffered - it is the live UI
+        memory_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+        )
+        atexit.register(memory_handler.flush)
+        handlers.append(memory_handler)
 
     logging.basicConfig(
         level=log_level,
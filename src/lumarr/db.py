@@ -1,14 +1,139 @@
 """Database operations for tracking synced items."""
 
 import json
+import pickle
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 from .models import MediaType, RequestStatus
 
+# Table DDL in one script wrapped in a single transaction, so a
+# first-time init pays one WAL sync instead of one autocommit per
+# statement. Secondary indexes live in _INDEX_SQL and are built lazily.
+# synced_at and cached_at hold integer epoch seconds - cheaper to write,
+# compare and index than ISO text - and the UPDATEs below convert rows
+# written before the switch (no-ops once everything is numeric)
+_TABLE_SQL = """
+BEGIN;
+CREATE TABLE IF NOT EXISTS synced_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rating_key TEXT NOT NULL,
+    title TEXT NOT NULL,
+    media_type TEXT NOT NULL,
+    tmdb_id TEXT,
+    tvdb_id TEXT,
+    imdb_id TEXT,
+    target_service TEXT NOT NULL,
+    status TEXT NOT NULL,
+    synced_at INTEGER DEFAULT (strftime('%s', 'now')),
+    error_message TEXT,
+    UNIQUE(rating_key, target_service)
+);
+UPDATE synced_items
+    SET synced_at = CAST(strftime('%s', synced_at) AS INTEGER)
+    WHERE typeof(synced_at) = 'text'
+    AND strftime('%s', synced_at) IS NOT NULL;
+CREATE TABLE IF NOT EXISTS watchlist_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rating_key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    media_type TEXT NOT NULL,
+    first_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_baseline INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS metadata_cache (
+    rating_key TEXT PRIMARY KEY,
+    metadata_json TEXT NOT NULL,
+    cached_at INTEGER DEFAULT (strftime('%s', 'now'))
+);
+UPDATE metadata_cache
+    SET cached_at = CAST(strftime('%s', cached_at) AS INTEGER)
+    WHERE typeof(cached_at) = 'text'
+    AND strftime('%s', cached_at) IS NOT NULL;
+CREATE TABLE IF NOT EXISTS letterboxd_metadata (
+    letterboxd_id TEXT PRIMARY KEY,
+    slug TEXT NOT NULL,
+    tmdb_id TEXT,
+    title TEXT,
+    year INTEGER,
+    fetched_at TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS tmdb_id_mapping (
+    source_type TEXT NOT NULL,
+    source_id TEXT NOT NULL,
+    tmdb_id TEXT,
+    tvdb_id TEXT,
+    imdb_id TEXT,
+    fetched_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (source_type, source_id)
+);
+CREATE TABLE IF NOT EXISTS baseline_runs (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    completed_at TIMESTAMP NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE TABLE IF NOT EXISTS http_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body TEXT NOT NULL,
+    fetched_at TIMESTAMP
+);
+COMMIT;
+"""
+
+# Secondary (non-UNIQUE) indexes, built after data exists rather than at
+# table creation so a baseline import on a fresh database inserts into
+# index-free tables and pays each B-tree build once at the end. The old
+# idx_rating_key is dropped: UNIQUE(rating_key, target_service) already
+# provides an index with the same leading column, so it only added write
+# cost. ANALYZE afterwards gives the planner fresh statistics
+_INDEX_SQL = """
+BEGIN;
+DROP INDEX IF EXISTS idx_rating_key;
+CREATE INDEX IF NOT EXISTS idx_tmdb_id
+    ON synced_items(tmdb_id);
+CREATE INDEX IF NOT EXISTS idx_watchlist_rating_key
+    ON watchlist_items(rating_key);
+CREATE INDEX IF NOT EXISTS idx_metadata_cache_cached_at
+    ON metadata_cache(cached_at);
+CREATE INDEX IF NOT EXISTS idx_letterboxd_slug
+    ON letterboxd_metadata(slug);
+CREATE INDEX IF NOT EXISTS idx_letterboxd_tmdb_id
+    ON letterboxd_metadata(tmdb_id);
+COMMIT;
+ANALYZE;
+"""
+
+
+def _pack_metadata(metadata: Dict) -> bytes:
+    """Serialize a metadata dict for the cache.
+
+    Pickle instead of JSON: binary framing packs and parses several
+    times faster and the rows come out smaller. The cache is local
+    state this process wrote itself, so unpickling it is no more of a
+    trust step than opening the database file.
+    """
+    return pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _unpack_metadata(raw) -> Dict:
+    """Deserialize a cached metadata payload.
+
+    Rows written before the pickle switch hold JSON text; SQLite's
+    dynamic typing hands those back as str, so dispatch on the Python
+    type rather than migrating the table.
+    """
+    if isinstance(raw, bytes):
+        return pickle.loads(raw)
+    return json.loads(raw)
+
 
 class Database:
     """SQLite database for tracking synced watchlist items."""
@@ -20,90 +145,79 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = Path(db_path)
+        self._indexes_ready = False
+        self._conn = None
+        # Reentrant so a method iterating a cursor can call back into the
+        # Database; also serializes writer threads (the TMDB prefetch
+        # pool) over the one shared connection
+        self._conn_lock = threading.RLock()
         self._init_db()
 
     def _init_db(self):
         """Create database tables if they don't exist."""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS synced_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    rating_key TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    media_type TEXT NOT NULL,
-                    tmdb_id TEXT,
-                    tvdb_id TEXT,
-                    imdb_id TEXT,
-                    target_service TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    error_message TEXT,
-                    UNIQUE(rating_key, target_service)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_rating_key
-                ON synced_items(rating_key)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_tmdb_id
-                ON synced_items(tmdb_id)
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS watchlist_items (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    rating_key TEXT NOT NULL UNIQUE,
-                    title TEXT NOT NULL,
-                    media_type TEXT NOT NULL,
-                    first_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_baseline INTEGER DEFAULT 0
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_watchlist_rating_key
-                ON watchlist_items(rating_key)
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata_cache (
-                    rating_key TEXT PRIMARY KEY,
-                    metadata_json TEXT NOT NULL,
-                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_metadata_cache_cached_at
-                ON metadata_cache(cached_at)
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS letterboxd_metadata (
-                    letterboxd_id TEXT PRIMARY KEY,
-                    slug TEXT NOT NULL,
-                    tmdb_id TEXT,
-                    title TEXT,
-                    year INTEGER,
-                    fetched_at TIMESTAMP
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_letterboxd_slug
-                ON letterboxd_metadata(slug)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_letterboxd_tmdb_id
-                ON letterboxd_metadata(tmdb_id)
-            """)
-            conn.commit()
+            conn.executescript(_TABLE_SQL)
+
+    def _ensure_indexes(self):
+        """Build secondary indexes, once per Database instance.
+
+        Writers call this after committing. On a fresh database the first
+        write batch therefore lands in index-free tables and the indexes
+        are built once over the loaded data; on an existing database the
+        IF NOT EXISTS statements are no-ops and the flag short-circuits
+        every later call. Reads before the first write don't need the
+        indexes - a table only holds rows a writer already put there.
+        """
+        if self._indexes_ready:
+            return
+        with self.get_connection() as conn:
+            conn.executescript(_INDEX_SQL)
+        self._indexes_ready = True
 
     @contextmanager
     def get_connection(self):
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get database connection context manager.
+
+        Yields one long-lived connection rather than opening and closing
+        per call: the sync loop touches the database once or more per
+        item, and paying connect + pragma setup every time dominated the
+        cost of the queries themselves. The connection lock is held for
+        the duration of the block.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                # check_same_thread off because the TMDB prefetch pool
+                # writes from worker threads; the lock serializes access
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                # WAL lets readers proceed during writes and NORMAL skips
+                # the fsync-per-commit of FULL, which dominates
+                # small-write cost
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                # Read pages through the kernel page cache via mmap (256
+                # MB ceiling of address space, not resident memory) and
+                # let the page cache grow to 64 MB so repeated metadata
+                # lookups don't re-read from disk; temp structures for
+                # ORDER BY stay in memory
+                conn.execute("PRAGMA mmap_size=268435456")
+                conn.execute("PRAGMA cache_size=-65536")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                self._conn = conn
+            yield self._conn
+
+    def close(self):
+        """Close the underlying connection, if one was opened."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self):
         try:
-            yield conn
-        finally:
-            conn.close()
+            self.close()
+        except Exception:
+            pass
 
     def is_synced(self, rating_key: str, target_service: str) -> bool:
         """Check if item has already been synced successfully.
@@ -117,18 +231,82 @@ class Database:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # EXISTS stops at the first match instead of counting rows
             cursor.execute(
                 """
-                SELECT COUNT(*) as count
+                SELECT EXISTS(
+                    SELECT 1 FROM synced_items
+                    WHERE rating_key = ?
+                    AND target_service = ?
+                    AND status = ?
+                )
+                """,
+                (rating_key, target_service, RequestStatus.SUCCESS.value)
+            )
+            return bool(cursor.fetchone()[0])
+
+    def get_synced_set(self, rating_keys: List[str], target_service: str) -> set:
+        """Get the subset of rating keys already synced successfully.
+
+        Answers is_synced for many items with one query per 900 keys
+        instead of one query per item, which matters when establishing a
+        baseline over large watchlists.
+
+        Args:
+            rating_keys: Plex rating keys to check
+            target_service: Target service (sonarr/radarr)
+
+        Returns:
+            Set of rating keys with a successful sync recorded
+        """
+        synced = set()
+        if not rating_keys:
+            return synced
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay under SQLite's default 999 host-parameter limit
+            for start in range(0, len(rating_keys), 900):
+                chunk = rating_keys[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT rating_key
+                    FROM synced_items
+                    WHERE target_service = ?
+                    AND status = ?
+                    AND rating_key IN ({placeholders})
+                    """,
+                    [target_service, RequestStatus.SUCCESS.value, *chunk]
+                )
+                synced.update(row["rating_key"] for row in cursor)
+        return synced
+
+    def get_synced_keys(self, target_service: str) -> set:
+        """Get every rating key successfully synced to a service.
+
+        One query answers is_synced for the whole watchlist, so the sync
+        loop can test membership in memory instead of issuing a SELECT
+        per item.
+
+        Args:
+            target_service: Target service (sonarr/radarr)
+
+        Returns:
+            Set of all rating keys with a successful sync recorded
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT rating_key
                 FROM synced_items
-                WHERE rating_key = ?
-                AND target_service = ?
+                WHERE target_service = ?
                 AND status = ?
                 """,
-                (rating_key, target_service, RequestStatus.SUCCESS.value)
+                (target_service, RequestStatus.SUCCESS.value)
             )
-            row = cursor.fetchone()
-            return row["count"] > 0
+            return {row["rating_key"] for row in cursor}
 
     def record_sync(
         self,
@@ -157,12 +335,24 @@ class Database:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Upsert rather than OR REPLACE: REPLACE deletes and
+            # re-inserts the row, churning the rowid and every index,
+            # while DO UPDATE rewrites the existing row in place
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO synced_items
+                INSERT INTO synced_items
                 (rating_key, title, media_type, tmdb_id, tvdb_id, imdb_id,
                  target_service, status, synced_at, error_message)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rating_key, target_service) DO UPDATE SET
+                    title = excluded.title,
+                    media_type = excluded.media_type,
+                    tmdb_id = excluded.tmdb_id,
+                    tvdb_id = excluded.tvdb_id,
+                    imdb_id = excluded.imdb_id,
+                    status = excluded.status,
+                    synced_at = excluded.synced_at,
+                    error_message = excluded.error_message
                 """,
                 (
                     rating_key,
@@ -173,11 +363,51 @@ class Database:
                     imdb_id,
                     target_service,
                     status.value,
-                    datetime.now().isoformat(),
+                    int(time.time()),
                     error_message,
                 ),
             )
             conn.commit()
+        self._ensure_indexes()
+
+    def record_sync_many(self, rows: List[tuple]):
+        """Record many sync operations in one transaction.
+
+        Per-row record_sync calls cost a connection and a commit (fsync)
+        each; this flushes an entire batch with one executemany and a
+        single commit.
+
+        Args:
+            rows: Tuples of (rating_key, title, media_type, tmdb_id,
+                tvdb_id, imdb_id, target_service, status, error_message)
+                with media_type and status as their enum values
+        """
+        if not rows:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            now = int(time.time())
+            cursor.executemany(
+                """
+                INSERT INTO synced_items
+                (rating_key, title, media_type, tmdb_id, tvdb_id, imdb_id,
+                 target_service, status, error_message, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rating_key, target_service) DO UPDATE SET
+                    title = excluded.title,
+                    media_type = excluded.media_type,
+                    tmdb_id = excluded.tmdb_id,
+                    tvdb_id = excluded.tvdb_id,
+                    imdb_id = excluded.imdb_id,
+                    status = excluded.status,
+                    error_message = excluded.error_message,
+                    synced_at = excluded.synced_at
+                """,
+                [row + (now,) for row in rows]
+            )
+            conn.commit()
+        self._ensure_indexes()
 
     def get_sync_history(self, limit: int = 50):
         """Get recent sync history.
@@ -198,7 +428,33 @@ class Database:
                 """,
                 (limit,)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor]
+
+    def get_sync_history_iter(self, limit: int = 50):
+        """Iterate over recent sync history without materializing it.
+
+        Streams rows straight from the cursor so callers rendering or
+        counting large histories hold one row at a time instead of the
+        whole result set.
+
+        Args:
+            limit: Maximum number of records to yield
+
+        Yields:
+            Sync history records as dicts, newest first
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT * FROM synced_items
+                ORDER BY synced_at DESC
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            for row in cursor:
+                yield dict(row)
 
     def clear_history(self):
         """Clear all sync history."""
@@ -233,6 +489,36 @@ class Database:
                 (rating_key, title, media_type.value, 1 if is_baseline else 0),
             )
             conn.commit()
+        self._ensure_indexes()
+
+    def mark_watchlist_items_seen(self, rows: List[tuple], is_baseline: bool = False):
+        """Mark many watchlist items as seen in one transaction.
+
+        The per-item variant commits (and syncs) once per call; this
+        flushes a whole snapshot with one executemany and a single
+        commit.
+
+        Args:
+            rows: Tuples of (rating_key, title, media_type) with
+                media_type as its enum value
+            is_baseline: Whether these are baseline items
+        """
+        if not rows:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            baseline = 1 if is_baseline else 0
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO watchlist_items
+                (rating_key, title, media_type, is_baseline)
+                VALUES (?, ?, ?, ?)
+                """,
+                [row + (baseline,) for row in rows]
+            )
+            conn.commit()
+        self._ensure_indexes()
 
     def is_baseline_item(self, rating_key: str) -> bool:
         """Check if an item was part of the baseline watchlist.
@@ -247,14 +533,15 @@ class Database:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT is_baseline
-                FROM watchlist_items
-                WHERE rating_key = ?
+                SELECT EXISTS(
+                    SELECT 1 FROM watchlist_items
+                    WHERE rating_key = ?
+                    AND is_baseline = 1
+                )
                 """,
                 (rating_key,)
             )
-            row = cursor.fetchone()
-            return row and row["is_baseline"] == 1
+            return bool(cursor.fetchone()[0])
 
     def is_seen(self, rating_key: str) -> bool:
         """Check if an item has been seen in the watchlist before.
@@ -269,14 +556,14 @@ class Database:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT COUNT(*) as count
-                FROM watchlist_items
-                WHERE rating_key = ?
+                SELECT EXISTS(
+                    SELECT 1 FROM watchlist_items
+                    WHERE rating_key = ?
+                )
                 """,
                 (rating_key,)
             )
-            row = cursor.fetchone()
-            return row["count"] > 0
+            return bool(cursor.fetchone()[0])
 
     def get_metadata_cache(self, rating_key: str) -> Optional[Dict]:
         """Get cached metadata for a rating key.
@@ -300,7 +587,7 @@ class Database:
             row = cursor.fetchone()
             if row:
                 return {
-                    "metadata": json.loads(row["metadata_json"]),
+                    "metadata": _unpack_metadata(row["metadata_json"]),
                     "cached_at": row["cached_at"]
                 }
             return None
@@ -329,9 +616,9 @@ class Database:
                 rating_keys
             )
             result = {}
-            for row in cursor.fetchall():
+            for row in cursor:
                 result[row["rating_key"]] = {
-                    "metadata": json.loads(row["metadata_json"]),
+                    "metadata": _unpack_metadata(row["metadata_json"]),
                     "cached_at": row["cached_at"]
                 }
             return result
@@ -347,13 +634,17 @@ class Database:
             cursor = conn.cursor()
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO metadata_cache
+                INSERT INTO metadata_cache
                 (rating_key, metadata_json, cached_at)
                 VALUES (?, ?, ?)
+                ON CONFLICT(rating_key) DO UPDATE SET
+                    metadata_json = excluded.metadata_json,
+                    cached_at = excluded.cached_at
                 """,
-                (rating_key, json.dumps(metadata), datetime.now().isoformat())
+                (rating_key, _pack_metadata(metadata), int(time.time()))
             )
             conn.commit()
+        self._ensure_indexes()
 
     def set_multiple_metadata_cache(self, metadata_dict: Dict[str, Dict]):
         """Store multiple metadata items in cache.
@@ -366,20 +657,24 @@ class Database:
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            now = datetime.now().isoformat()
+            now = int(time.time())
             data = [
-                (rating_key, json.dumps(metadata), now)
+                (rating_key, _pack_metadata(metadata), now)
                 for rating_key, metadata in metadata_dict.items()
             ]
             cursor.executemany(
                 """
-                INSERT OR REPLACE INTO metadata_cache
+                INSERT INTO metadata_cache
                 (rating_key, metadata_json, cached_at)
                 VALUES (?, ?, ?)
+                ON CONFLICT(rating_key) DO UPDATE SET
+                    metadata_json = excluded.metadata_json,
+                    cached_at = excluded.cached_at
                 """,
                 data
             )
             conn.commit()
+        self._ensure_indexes()
 
     def is_cache_stale(self, rating_key: str, max_age_days: int = 7) -> bool:
         """Check if cached metadata is stale.
@@ -395,9 +690,7 @@ class Database:
         if not cached:
             return True
 
-        cached_at = datetime.fromisoformat(cached["cached_at"])
-        age = datetime.now() - cached_at
-        return age > timedelta(days=max_age_days)
+        return time.time() - cached["cached_at"] > max_age_days * 86400
 
     def clear_metadata_cache(self):
         """Clear all metadata cache."""
@@ -414,7 +707,7 @@ class Database:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+            cutoff = int(time.time()) - max_age_days * 86400
             cursor.execute(
                 """
                 DELETE FROM metadata_cache
@@ -448,6 +741,38 @@ class Database:
                 return dict(row)
             return None
 
+    def get_letterboxd_metadata_many(self, letterboxd_ids: List[str]) -> Dict[str, Dict]:
+        """Get cached Letterboxd metadata for many films at once.
+
+        Args:
+            letterboxd_ids: Letterboxd film IDs to look up
+
+        Returns:
+            Dict mapping letterboxd_id to its metadata dict; IDs with no
+            cache entry are absent
+        """
+        found = {}
+        if not letterboxd_ids:
+            return found
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            # Stay under SQLite's default 999 host-parameter limit
+            for start in range(0, len(letterboxd_ids), 900):
+                chunk = letterboxd_ids[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"""
+                    SELECT letterboxd_id, slug, tmdb_id, title, year, fetched_at
+                    FROM letterboxd_metadata
+                    WHERE letterboxd_id IN ({placeholders})
+                    """,
+                    chunk
+                )
+                for row in cursor:
+                    found[row["letterboxd_id"]] = dict(row)
+        return found
+
     def set_letterboxd_metadata(
         self,
         letterboxd_id: str,
@@ -467,16 +792,239 @@ class Database:
         """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            fetched_at = datetime.now().isoformat() if tmdb_id else None
+            # Failures are stamped too, so the negative cache can be aged
+            # out instead of living forever
+            fetched_at = datetime.now().isoformat()
             cursor.execute(
                 """
-                INSERT OR REPLACE INTO letterboxd_metadata
+                INSERT INTO letterboxd_metadata
                 (letterboxd_id, slug, tmdb_id, title, year, fetched_at)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(letterboxd_id) DO UPDATE SET
+                    slug = excluded.slug,
+                    tmdb_id = excluded.tmdb_id,
+                    title = excluded.title,
+                    year = excluded.year,
+                    fetched_at = excluded.fetched_at
                 """,
                 (letterboxd_id, slug, tmdb_id, title, year, fetched_at)
             )
             conn.commit()
+        self._ensure_indexes()
+
+    def set_letterboxd_metadata_many(self, rows: List[tuple], attempted: bool = True):
+        """Store many Letterboxd metadata rows in one transaction.
+
+        Args:
+            rows: Tuples of (letterboxd_id, slug, tmdb_id, title, year)
+            attempted: Whether a TMDB lookup was actually attempted for
+                these rows. The baseline import passes False: its rows
+                carry tmdb_id=None without ever having tried a fetch, so
+                fetched_at stays NULL (a NULL row is retried, a stamped
+                one is a negative-cache hit) and any tmdb_id/fetched_at
+                an earlier fetch already recorded is preserved
+        """
+        if not rows:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            if attempted:
+                now = datetime.now().isoformat()
+                cursor.executemany(
+                    """
+                    INSERT INTO letterboxd_metadata
+                    (letterboxd_id, slug, tmdb_id, title, year, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(letterboxd_id) DO UPDATE SET
+                        slug = excluded.slug,
+                        tmdb_id = excluded.tmdb_id,
+                        title = excluded.title,
+                        year = excluded.year,
+                        fetched_at = excluded.fetched_at
+                    """,
+                    [
+                        (letterboxd_id, slug, tmdb_id, title, year, now)
+                        for letterboxd_id, slug, tmdb_id, title, year in rows
+                    ]
+                )
+            else:
+                cursor.executemany(
+                    """
+                    INSERT INTO letterboxd_metadata
+                    (letterboxd_id, slug, tmdb_id, title, year, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, NULL)
+                    ON CONFLICT(letterboxd_id) DO UPDATE SET
+                        slug = excluded.slug,
+                        title = excluded.title,
+                        year = excluded.year
+                    """,
+                    rows
+                )
+            conn.commit()
+        self._ensure_indexes()
+
+    def get_id_mapping(self, source_type: str, source_id: str) -> Optional[Dict]:
+        """Get a cached provider ID mapping.
+
+        Args:
+            source_type: Source ID kind (e.g. 'imdb', 'tvdb')
+            source_id: Source ID value
+
+        Returns:
+            Mapping dict with tmdb_id/tvdb_id/imdb_id/fetched_at, or None
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT tmdb_id, tvdb_id, imdb_id, fetched_at
+                FROM tmdb_id_mapping
+                WHERE source_type = ? AND source_id = ?
+                """,
+                (source_type, source_id)
+            )
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+    def set_id_mapping(
+        self,
+        source_type: str,
+        source_id: str,
+        tmdb_id: Optional[str] = None,
+        tvdb_id: Optional[str] = None,
+        imdb_id: Optional[str] = None,
+    ):
+        """Store or update a provider ID mapping.
+
+        Args:
+            source_type: Source ID kind (e.g. 'imdb', 'tvdb')
+            source_id: Source ID value
+            tmdb_id: Resolved TMDB ID
+            tvdb_id: Resolved TVDB ID
+            imdb_id: Resolved IMDB ID
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO tmdb_id_mapping
+                (source_type, source_id, tmdb_id, tvdb_id, imdb_id, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(source_type, source_id) DO UPDATE SET
+                    tmdb_id = excluded.tmdb_id,
+                    tvdb_id = excluded.tvdb_id,
+                    imdb_id = excluded.imdb_id,
+                    fetched_at = excluded.fetched_at
+                """,
+                (source_type, source_id, tmdb_id, tvdb_id, imdb_id,
+                 datetime.now().isoformat())
+            )
+            conn.commit()
+
+    def get_baseline_timestamp(self, kind: str, key: str) -> Optional[datetime]:
+        """Get when a baseline was last completed for a source.
+
+        Args:
+            kind: Source kind (e.g. 'letterboxd_rss', 'letterboxd_watchlist')
+            key: Source key, usually a username
+
+        Returns:
+            Completion time as a datetime, or None if never baselined
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT completed_at
+                FROM baseline_runs
+                WHERE kind = ? AND key = ?
+                """,
+                (kind, key)
+            )
+            row = cursor.fetchone()
+            if row:
+                return datetime.fromisoformat(row["completed_at"])
+            return None
+
+    def set_baseline_timestamp(self, kind: str, key: str):
+        """Record that a baseline just completed for a source.
+
+        Args:
+            kind: Source kind (e.g. 'letterboxd_rss', 'letterboxd_watchlist')
+            key: Source key, usually a username
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO baseline_runs
+                (kind, key, completed_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(kind, key) DO UPDATE SET
+                    completed_at = excluded.completed_at
+                """,
+                (kind, key, datetime.now().isoformat())
+            )
+            conn.commit()
+
+    def get_http_cache(self, url: str) -> Optional[Dict]:
+        """Get a cached HTTP response with its validators.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Dict with etag, last_modified and body, or None if not cached
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT url, etag, last_modified, body, fetched_at
+                FROM http_cache
+                WHERE url = ?
+                """,
+                (url,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return dict(row)
+            return None
+
+    def set_http_cache(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: str,
+    ):
+        """Store or update a cached HTTP response.
+
+        Args:
+            url: Request URL
+            etag: ETag header value if the server sent one
+            last_modified: Last-Modified header value if sent
+            body: Response body
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO http_cache
+                (url, etag, last_modified, body, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    body = excluded.body,
+                    fetched_at = excluded.fetched_at
+                """,
+                (url, etag, last_modified, body, datetime.now().isoformat())
+            )
+            conn.commit()
 
     def update_letterboxd_tmdb_id(self, letterboxd_id: str, tmdb_id: str):
         """Update TMDB ID for a Letterboxd item.
@@ -496,6 +1044,7 @@ class Database:
                 (tmdb_id, datetime.now().isoformat(), letterboxd_id)
             )
             conn.commit()
+        self._ensure_indexes()
 
     def get_letterboxd_by_slug(self, slug: str) -> Optional[Dict]:
         """Get Letterboxd metadata by slug.
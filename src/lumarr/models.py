@@ -1,6 +1,5 @@
 """Data models for Plex watchlist items."""
 
-from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
@@ -19,58 +18,196 @@ class RequestStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
 class ProviderId:
-    """Provider IDs for cross-referencing media across services."""
-    tmdb_id: Optional[str] = None
-    tvdb_id: Optional[str] = None
-    imdb_id: Optional[str] = None
+    """Provider IDs for cross-referencing media across services.
+
+    Slotted because one instance rides along with every watchlist item
+    and its three fields are read in every hot path of the sync loop
+    (dataclass slots=True would need Python 3.10).
+    """
+
+    __slots__ = ("tmdb_id", "tvdb_id", "imdb_id")
+
+    def __init__(
+        self,
+        tmdb_id: Optional[str] = None,
+        tvdb_id: Optional[str] = None,
+        imdb_id: Optional[str] = None,
+    ):
+        self.tmdb_id = tmdb_id
+        self.tvdb_id = tvdb_id
+        self.imdb_id = imdb_id
 
 
-@dataclass
 class WatchlistItem:
-    """Item from Plex watchlist."""
-    rating_key: str
-    title: str
-    media_type: MediaType
-    year: Optional[int] = None
-    guids: list[str] = None
-    provider_ids: Optional[ProviderId] = None
-    content_rating: Optional[str] = None
-    summary: Optional[str] = None
-    genres: list[str] = None
-    studio: Optional[str] = None
-    added_at: Optional[int] = None
-    rating: Optional[float] = None
-    letterboxd_id: Optional[str] = None
-    letterboxd_slug: Optional[str] = None
-
-    def __post_init__(self):
-        if self.guids is None:
-            self.guids = []
-        if self.genres is None:
-            self.genres = []
-
-
-@dataclass
+    """Item from Plex watchlist.
+
+    A __slots__ class: one is allocated per watchlist entry and held for
+    the whole sync pass, so dropping the per-instance __dict__ is worth
+    the explicit __init__.
+    """
+
+    __slots__ = (
+        "rating_key",
+        "title",
+        "media_type",
+        "year",
+        "guids",
+        "provider_ids",
+        "content_rating",
+        "summary",
+        "genres",
+        "studio",
+        "added_at",
+        "rating",
+        "letterboxd_id",
+        "letterboxd_slug",
+    )
+
+    def __init__(
+        self,
+        rating_key: str,
+        title: str,
+        media_type: MediaType,
+        year: Optional[int] = None,
+        guids: Optional[list[str]] = None,
+        provider_ids: Optional[ProviderId] = None,
+        content_rating: Optional[str] = None,
+        summary: Optional[str] = None,
+        genres: Optional[list[str]] = None,
+        studio: Optional[str] = None,
+        added_at: Optional[int] = None,
+        rating: Optional[float] = None,
+        letterboxd_id: Optional[str] = None,
+        letterboxd_slug: Optional[str] = None,
+    ):
+        self.rating_key = rating_key
+        self.title = title
+        self.media_type = media_type
+        self.year = year
+        self.guids = guids if guids is not None else []
+        self.provider_ids = provider_ids
+        self.content_rating = content_rating
+        self.summary = summary
+        self.genres = genres if genres is not None else []
+        self.studio = studio
+        self.added_at = added_at
+        self.rating = rating
+        self.letterboxd_id = letterboxd_id
+        self.letterboxd_slug = letterboxd_slug
+
+
+def dedup_by_rating_key(items):
+    """Yield items with duplicate rating keys dropped, keeping first seen.
+
+    One pass with a seen-set, so chained iterators dedup without the
+    intermediate dict and list the callers used to build.
+
+    Args:
+        items: Iterable of WatchlistItem objects
+
+    Yields:
+        WatchlistItem objects in input order, first occurrence wins
+    """
+    seen = set()
+    for item in items:
+        key = item.rating_key
+        if key in seen:
+            continue
+        seen.add(key)
+        yield item
+
+
 class SyncResult:
-    """Result of syncing a single item."""
-    item: WatchlistItem
-    status: RequestStatus
-    message: str
-    target_service: str
+    """Result of syncing a single item.
+
+    A __slots__ class for the same reason as LetterboxdSyncResult: one
+    per watchlist item on large syncs, so the per-instance __dict__ is
+    worth avoiding.
+    """
+
+    __slots__ = ("item", "status", "message", "target_service")
+
+    def __init__(
+        self,
+        item: WatchlistItem,
+        status: RequestStatus,
+        message: str,
+        target_service: str,
+    ):
+        self.item = item
+        self.status = status
+        self.message = message
+        self.target_service = target_service
+
+
+class LetterboxdSyncResult:
+    """Outcome of syncing one Letterboxd item.
+
+    A __slots__ class rather than a dataclass: one of these is allocated
+    per item on large syncs, and slots keep that allocation small
+    (dataclass slots=True would need Python 3.10).
+    """
+
+    __slots__ = ("item", "status", "message")
+
+    def __init__(self, item: WatchlistItem, status: RequestStatus, message: str):
+        self.item = item
+        self.status = status
+        self.message = message
+
+
+class LetterboxdSyncSummary:
+    """Aggregated counters and results for one Letterboxd sync pass."""
+
+    __slots__ = ("total", "added", "skipped", "failed", "results")
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.added = 0
+        self.skipped = 0
+        self.failed = 0
+        self.results: list = []
 
 
-@dataclass
 class SyncSummary:
     """Summary of entire sync operation."""
-    total: int = 0
-    movies_added: int = 0
-    shows_added: int = 0
-    skipped: int = 0
-    failed: int = 0
-    results: list[SyncResult] = None
-
-    def __post_init__(self):
-        if self.results is None:
-            self.results = []
+
+    __slots__ = ("total", "movies_added", "shows_added", "skipped", "failed", "results")
+
+    # (status, media_type) -> counter attribute, so the per-item tally is
+    # one dict lookup instead of a branch chain over enum comparisons
+    _COUNTER_ATTRS = {
+        (RequestStatus.SUCCESS, MediaType.MOVIE): "movies_added",
+        (RequestStatus.SUCCESS, MediaType.TV_SHOW): "shows_added",
+        (RequestStatus.SKIPPED, MediaType.MOVIE): "skipped",
+        (RequestStatus.SKIPPED, MediaType.TV_SHOW): "skipped",
+        (RequestStatus.FAILED, MediaType.MOVIE): "failed",
+        (RequestStatus.FAILED, MediaType.TV_SHOW): "failed",
+    }
+
+    def __init__(self, total: int = 0):
+        self.total = total
+        self.movies_added = 0
+        self.shows_added = 0
+        self.skipped = 0
+        self.failed = 0
+        self.results: list = []
+
+    def tally(self, status: RequestStatus, media_type: MediaType):
+        """Bump the counter matching one item's outcome.
+
+        Unknown combinations (e.g. a failed item with an unsupported
+        media type) fall back to the failed counter when the status says
+        so and are otherwise ignored.
+
+        Args:
+            status: Outcome status of the item
+            media_type: The item's media type
+        """
+        attr = self._COUNTER_ATTRS.get((status, media_type))
+        if attr is None:
+            if status is not RequestStatus.FAILED:
+                return
+            attr = "failed"
+        setattr(self, attr, getattr(self, attr) + 1)